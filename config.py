@@ -22,12 +22,20 @@ class Config:
     # ETL Configuration
     BATCH_SIZE = int(os.getenv('BATCH_SIZE', '10000'))  # Number of rows to process in each batch
     MAX_WORKERS = int(os.getenv('MAX_WORKERS', '4'))    # Number of parallel workers
+    USE_PROCESS_POOL = os.getenv('USE_PROCESS_POOL', 'false').lower() == 'true'  # Run key-range and temp-table workers as processes
     CHUNK_SIZE = int(os.getenv('CHUNK_SIZE', '50000'))  # Pandas chunk size for reading
+    USE_COPY = os.getenv('USE_COPY', 'true').lower() == 'true'  # Load with COPY instead of INSERT
+    INSERT_PAGE_SIZE = int(os.getenv('INSERT_PAGE_SIZE', '10000'))  # Rows per INSERT statement when USE_COPY is off
+    SYNCHRONOUS_COMMIT = os.getenv('SYNCHRONOUS_COMMIT', 'false').lower() == 'true'  # Wait for the WAL flush on every batch commit
     
     # Table Splitting Configuration
     ENABLE_TABLE_SPLITTING = os.getenv('ENABLE_TABLE_SPLITTING', 'true').lower() == 'true'
     NUMBER_OF_SPLITS = int(os.getenv('NUMBER_OF_SPLITS', '10'))  # Number of temporary tables to create
     ETL_INTERNAL_SCHEMA = os.getenv('ETL_INTERNAL_SCHEMA', 'etl_internal')  # Schema for temporary tables
+    TEMP_TABLES_UNLOGGED = os.getenv('TEMP_TABLES_UNLOGGED', 'true').lower() == 'true'  # Create temporary tables without WAL
+    INDEX_BACKUP_PATH = os.getenv('INDEX_BACKUP_PATH', 'etl_target_indexes.json')  # Definitions of the target indexes dropped for the load
+    CHECKPOINT_PATH = os.getenv('CHECKPOINT_PATH', 'etl_checkpoint.json')  # Progress of a split transfer, to resume after a failure
+    CHECKPOINT_MAX_AGE = int(os.getenv('CHECKPOINT_MAX_AGE', '43200'))  # Seconds after which a checkpoint is not resumed
     
     # Table Configuration
     SOURCE_TABLE = os.getenv('SOURCE_TABLE', 'your_source_table')
@@ -43,6 +51,9 @@ class Config:
     CONNECTION_TIMEOUT = int(os.getenv('CONNECTION_TIMEOUT', '30'))
     QUERY_TIMEOUT = int(os.getenv('QUERY_TIMEOUT', '300'))
     
+    # Introspection cache (seconds to keep table schemas/table lists; 0 disables)
+    SCHEMA_CACHE_TTL = int(os.getenv('SCHEMA_CACHE_TTL', '300'))
+    
     @classmethod
     def get_source_connection_string(cls):
         """Get source database connection string"""
@@ -1,75 +1,329 @@
 import psycopg2
+import psycopg2.errors
+import psycopg2.pool
+import psycopg2.extensions
+import psycopg2.extras
+from psycopg2 import sql
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+import io
 import logging
-from typing import Optional, List, Dict, Any
+import threading
+import time
+import weakref
+import hashlib
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Tuple, Iterator, Union
 from config import Config
 
+class BlockingConnectionPool(psycopg2.pool.ThreadedConnectionPool):
+    """
+    ThreadedConnectionPool that waits for a free connection instead of raising PoolError
+    
+    Workers that outnumber the pool then queue on checkout rather than fail;
+    getconn only raises if no connection is returned within the timeout.
+    
+    Only minconn connections are opened up front, but every returned
+    connection is kept for reuse, up to maxconn.
+    """
+    
+    def __init__(self, minconn: int, maxconn: int, *args, timeout: float = 30, **kwargs):
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._checkout_timeout = timeout
+        super().__init__(minconn, maxconn, *args, **kwargs)
+        # psycopg2 closes a returned connection once minconn are idle; raising
+        # the limit after the initial connections are opened keeps the
+        # connections (and the statements prepared on them) of every worker
+        self.minconn = maxconn
+    
+    def getconn(self, key=None):
+        if not self._slots.acquire(timeout=self._checkout_timeout):
+            raise psycopg2.pool.PoolError(f"no connection available within {self._checkout_timeout}s")
+        try:
+            return super().getconn(key)
+        except Exception:
+            self._slots.release()
+            raise
+    
+    def putconn(self, conn=None, key=None, close=False):
+        try:
+            super().putconn(conn, key, close)
+        finally:
+            self._slots.release()
+
 class DatabaseManager:
-    def __init__(self, connection_string: str, timeout: int = 30):
+    # Process-wide SQLAlchemy engines, keyed by connection string
+    _engines: Dict[str, Engine] = {}
+    _engines_lock = threading.Lock()
+    # Process-wide psycopg2 connection pools, keyed by (connection string, synchronous_commit)
+    _pools: Dict[Tuple[str, bool], BlockingConnectionPool] = {}
+    _pools_lock = threading.Lock()
+    # Names of server-side prepared statements, per pooled psycopg2 connection
+    _prepared: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+    _prepared_lock = threading.Lock()
+    # Heap page number past the last possible page (page numbers are 32-bit)
+    _END_PAGE = 2 ** 32 - 1
+    
+    def __init__(self, connection_string: str, timeout: int = 30, synchronous_commit: bool = True):
         """
         Initialize database manager with connection string
         
         Args:
             connection_string: PostgreSQL connection string
             timeout: Connection timeout in seconds
+            synchronous_commit: Whether commits on pooled psycopg2 connections
+                wait for their WAL to be flushed to disk
         """
         self.connection_string = connection_string
         self.timeout = timeout
+        self.synchronous_commit = synchronous_commit
+        # psycopg2 connect() keyword arguments, parsed from the DSN once
+        self._conn_kwargs = psycopg2.extensions.parse_dsn(connection_string)
+        self._conn_kwargs['connect_timeout'] = timeout
+        if not synchronous_commit:
+            # Batch commits return without waiting for the WAL flush; a crash
+            # can only lose the last few commits, and a rerun reloads the table
+            self._conn_kwargs['options'] = '-c synchronous_commit=off'
         self.engine = None
+        self._pool = None
         self.logger = logging.getLogger(__name__)
+        # Introspection results: cache key -> (expiry time, result)
+        self._schema_cache: Dict[tuple, tuple] = {}
+        self._schema_cache_lock = threading.Lock()
     
-    def get_engine(self):
-        """Get SQLAlchemy engine with connection pooling"""
+    def get_engine(self) -> Engine:
+        """
+        Get SQLAlchemy engine with connection pooling
+        
+        Engines are shared by every DatabaseManager in the process that uses
+        the same connection string, so all workers draw from one pool.
+        """
         if self.engine is None:
-            self.engine = create_engine(
-                self.connection_string,
-                pool_size=5,
-                max_overflow=10,
-                pool_timeout=30,
-                pool_recycle=3600,
-                connect_args={
-                    'connect_timeout': self.timeout,
-                    'options': f'-c statement_timeout={Config.QUERY_TIMEOUT * 1000}'
-                }
-            )
+            with DatabaseManager._engines_lock:
+                engine = DatabaseManager._engines.get(self.connection_string)
+                if engine is None:
+                    engine = create_engine(
+                        self.connection_string,
+                        pool_size=Config.MAX_WORKERS,
+                        max_overflow=Config.MAX_WORKERS,
+                        pool_timeout=30,
+                        pool_recycle=3600,
+                        pool_use_lifo=True,
+                        pool_pre_ping=True,
+                        connect_args={
+                            'connect_timeout': self.timeout,
+                            'options': f'-c statement_timeout={Config.QUERY_TIMEOUT * 1000}'
+                        }
+                    )
+                    DatabaseManager._engines[self.connection_string] = engine
+            self.engine = engine
         return self.engine
     
+    def _get_pool(self) -> BlockingConnectionPool:
+        """
+        Get (lazily creating) the shared psycopg2 pool for this connection string and commit mode
+        
+        The pool is looked up under the class-wide lock once and then kept on
+        the instance, so leasing a connection per batch takes no shared lock
+        beyond the pool's own.
+        
+        It holds up to two connections per worker (an extractor and a loader
+        can each hold one, e.g. when source and target share a database) plus
+        two spare for metadata queries issued while the workers run.
+        """
+        if self._pool is None or self._pool.closed:
+            with DatabaseManager._pools_lock:
+                pool_key = (self.connection_string, self.synchronous_commit)
+                connection_pool = DatabaseManager._pools.get(pool_key)
+                if connection_pool is None:
+                    connection_pool = BlockingConnectionPool(
+                        minconn=2,
+                        maxconn=Config.MAX_WORKERS * 2 + 2,
+                        timeout=Config.QUERY_TIMEOUT,
+                        **self._conn_kwargs
+                    )
+                    DatabaseManager._pools[pool_key] = connection_pool
+            self._pool = connection_pool
+        return self._pool
+    
+    @contextmanager
     def get_connection(self):
-        """Get direct psycopg2 connection"""
-        return psycopg2.connect(
-            self.connection_string,
-            connect_timeout=self.timeout
-        )
+        """
+        Lease a psycopg2 connection from the shared pool
+        
+        The connection is returned to the pool on exit; any transaction left
+        open by the caller is rolled back by the pool.
+        """
+        connection_pool = self._get_pool()
+        conn = connection_pool.getconn()
+        try:
+            yield conn
+        finally:
+            connection_pool.putconn(conn)
     
-    def test_connection(self) -> bool:
-        """Test database connection"""
+    @staticmethod
+    def _table_identifier(table_name: str, schema_name: str = None) -> sql.Identifier:
+        """Build a quoted, optionally schema-qualified, table identifier"""
+        if schema_name:
+            return sql.Identifier(schema_name, table_name)
+        return sql.Identifier(table_name)
+    
+    def _ensure_prepared(self, conn, statement_name: str, statement: sql.Composable):
+        """
+        PREPARE a statement on a pooled connection unless it was already prepared there
+        
+        Prepared statements live for the whole server session, so they are
+        tracked per connection and reused by later EXECUTE calls.
+        """
+        with DatabaseManager._prepared_lock:
+            prepared = DatabaseManager._prepared.setdefault(conn, set())
+            if statement_name in prepared:
+                return
+        
+        with conn.cursor() as cursor:
+            cursor.execute(sql.SQL("PREPARE {} AS {}").format(sql.Identifier(statement_name), statement))
+        
+        with DatabaseManager._prepared_lock:
+            prepared.add(statement_name)
+    
+    def _reprepare(self, conn, statement_name: str, statement: sql.Composable):
+        """
+        DEALLOCATE a statement prepared on a pooled connection and PREPARE it again
+        
+        Needed when the columns of a table behind a prepared SELECT * changed
+        (e.g. after ALTER TABLE), which makes EXECUTE fail with "cached plan
+        must not change result type".
+        """
+        with conn.cursor() as cursor:
+            cursor.execute(sql.SQL("DEALLOCATE {}").format(sql.Identifier(statement_name)))
+        
+        with DatabaseManager._prepared_lock:
+            DatabaseManager._prepared.setdefault(conn, set()).discard(statement_name)
+        self._ensure_prepared(conn, statement_name, statement)
+    
+    @contextmanager
+    def transaction(self, timeout: bool = True):
+        """
+        Run several statements in one transaction on a pooled engine connection
+        
+        Yields a DB-API cursor (psycopg2 %s placeholders). The transaction is
+        committed once on exit, or rolled back if the block raises.
+        
+        Args:
+            timeout: Whether the engine's QUERY_TIMEOUT statement_timeout applies.
+                Pass False for statements whose run time grows with the table
+                (full counts, index builds), which must not be cut off.
+        """
+        with self.get_engine().begin() as conn:
+            with conn.connection.cursor() as cursor:
+                if not timeout:
+                    cursor.execute("SET LOCAL statement_timeout = 0")
+                yield cursor
+    
+    def _exec(self, query, params: tuple = None, fetch: bool = False, timeout: bool = True) -> Optional[List]:
+        """
+        Execute a statement on a pooled engine connection and commit it
+        
+        Args:
+            query: SQL string or psycopg2.sql composable using psycopg2 (%s) placeholders
+            params: Optional query parameters
+            fetch: Whether to fetch and return all result rows
+            timeout: Whether the QUERY_TIMEOUT statement_timeout applies (see transaction)
+            
+        Returns:
+            Optional[List]: Result rows if fetch is True, otherwise None
+        """
+        with self.transaction(timeout) as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall() if fetch else None
+    
+    def ping(self) -> bool:
+        """
+        Check that a pooled psycopg2 connection still reaches the server
+        
+        Pooled connections can be cut while idle (e.g. by an RDS idle timeout
+        between scheduled runs). If the check fails the pool is closed, so the
+        next checkout opens fresh connections.
+        
+        Returns:
+            bool: True if the pooled connection answered, False if the pool was reset
+        """
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cursor:
                     cursor.execute("SELECT 1")
-                    result = cursor.fetchone()
-                    return result[0] == 1
+                conn.rollback()
+            return True
+        except psycopg2.Error as e:
+            self.logger.warning(f"Pooled connection check failed, reconnecting: {e}")
+            self.reset_pool()
+            return False
+    
+    def reset_pool(self):
+        """Close the shared psycopg2 pool for this connection string and commit mode"""
+        with DatabaseManager._pools_lock:
+            connection_pool = DatabaseManager._pools.pop((self.connection_string, self.synchronous_commit), None)
+        if connection_pool is not None and not connection_pool.closed:
+            connection_pool.closeall()
+        self._pool = None
+    
+    def test_connection(self) -> bool:
+        """
+        Test database connection
+        
+        Checking a connection out of the shared engine is enough: new connections
+        are established on checkout and pooled ones are validated by pool_pre_ping.
+        """
+        try:
+            self.get_engine().connect().close()
+            return True
         except Exception as e:
             self.logger.error(f"Connection test failed: {e}")
             return False
     
     def create_schema_if_not_exists(self, schema_name: str):
         """Create schema if it doesn't exist"""
-        query = f"CREATE SCHEMA IF NOT EXISTS {schema_name}"
+        query = sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(sql.Identifier(schema_name))
         
         try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    conn.commit()
+            self._exec(query)
             self.logger.info(f"Schema '{schema_name}' created/verified successfully")
         except Exception as e:
             self.logger.error(f"Failed to create schema '{schema_name}': {e}")
             raise
     
+    def _get_cached(self, cache_key: tuple):
+        """Return a cached introspection result, or None if missing or expired"""
+        with self._schema_cache_lock:
+            entry = self._schema_cache.get(cache_key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._schema_cache[cache_key]
+                return None
+            return list(value)
+    
+    def _set_cached(self, cache_key: tuple, value: list):
+        """Cache an introspection result for Config.SCHEMA_CACHE_TTL seconds"""
+        if Config.SCHEMA_CACHE_TTL <= 0:
+            return
+        with self._schema_cache_lock:
+            self._schema_cache[cache_key] = (time.monotonic() + Config.SCHEMA_CACHE_TTL, list(value))
+    
+    def invalidate_schema_cache(self):
+        """Clear cached introspection results (call after DDL)"""
+        with self._schema_cache_lock:
+            self._schema_cache.clear()
+    
     def get_table_schema(self, table_name: str, schema_name: str = None) -> List[Dict[str, Any]]:
-        """Get table schema information"""
+        """Get table schema information (cached for Config.SCHEMA_CACHE_TTL seconds)"""
+        cache_key = ('table_schema', table_name, schema_name)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         if schema_name:
             query = """
             SELECT 
@@ -96,162 +350,435 @@ class DatabaseManager:
             params = (table_name,)
         
         try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query, params)
-                    columns = cursor.fetchall()
-                    
-                    schema = []
-                    for col in columns:
-                        schema.append({
-                            'name': col[0],
-                            'type': col[1],
-                            'nullable': col[2] == 'YES',
-                            'default': col[3]
-                        })
-                    return schema
+            columns = self._exec(query, params, fetch=True)
+            
+            schema = []
+            for col in columns:
+                schema.append({
+                    'name': col[0],
+                    'type': col[1],
+                    'nullable': col[2] == 'YES',
+                    'default': col[3]
+                })
+            
+            if schema:
+                self._set_cached(cache_key, schema)
+            return schema
         except Exception as e:
             self.logger.error(f"Failed to get schema for table {table_name}: {e}")
             return []
     
-    def get_row_count(self, table_name: str, schema_name: str = None, where_clause: str = "") -> int:
-        """Get total row count for a table"""
+    def get_primary_key(self, table_name: str, schema_name: str = None) -> List[str]:
+        """
+        Get the primary key columns of a table, in key order (cached for Config.SCHEMA_CACHE_TTL seconds)
+        
+        Args:
+            table_name: Name of the table
+            schema_name: Optional schema of the table
+            
+        Returns:
+            List[str]: Primary key column names (empty if the table has no primary key)
+        """
+        cache_key = ('primary_key', table_name, schema_name)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         if schema_name:
-            query = f"SELECT COUNT(*) FROM {schema_name}.{table_name}"
+            relation = "to_regclass(quote_ident(%s) || '.' || quote_ident(%s))"
+            params = (schema_name, table_name)
         else:
-            query = f"SELECT COUNT(*) FROM {table_name}"
+            relation = "to_regclass(quote_ident(%s))"
+            params = (table_name,)
+        
+        query = f"""
+        SELECT a.attname
+        FROM pg_index i
+        JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+        WHERE i.indrelid = {relation} AND i.indisprimary
+        ORDER BY array_position(i.indkey::int2[], a.attnum)
+        """
+        
+        try:
+            primary_key = [row[0] for row in self._exec(query, params, fetch=True)]
+            if primary_key:
+                self._set_cached(cache_key, primary_key)
+            return primary_key
+        except Exception as e:
+            self.logger.error(f"Failed to get primary key for table {table_name}: {e}")
+            return []
+    
+    def get_key_ranges(self, table_name: str, schema_name: str, key_column: str,
+                       ranges: int) -> List[Tuple[Any, Any]]:
+        """
+        Split a table into contiguous, roughly equal-sized ranges of a unique key
+        
+        The boundaries are the first key of each NTILE bucket, computed in one
+        ordered pass over the key (an index-only scan for a primary key). The
+        pass covers the whole table, so it runs without QUERY_TIMEOUT.
+        
+        Args:
+            table_name: Name of the table
+            schema_name: Schema of the table
+            key_column: Unique column to split on
+            ranges: Number of ranges wanted (fewer are returned for tiny tables)
+            
+        Returns:
+            List[Tuple[Any, Any]]: (lower, upper) pairs covering key >= lower AND
+            key < upper; None means the range is open on that side
+        """
+        key = sql.Identifier(key_column)
+        query = sql.SQL("""
+        SELECT min({}) FROM (
+            SELECT {}, ntile(%s) OVER (ORDER BY {}) AS tile
+            FROM {}
+        ) tiles
+        GROUP BY tile
+        ORDER BY tile
+        """).format(key, key, key, self._table_identifier(table_name, schema_name))
+        
+        try:
+            boundaries = [row[0] for row in self._exec(query, (ranges,), fetch=True, timeout=False)[1:]]
+            return list(zip([None] + boundaries, boundaries + [None]))
+        except Exception as e:
+            self.logger.error(f"Failed to compute key ranges for {schema_name}.{table_name}: {e}")
+            raise
+    
+    def get_page_ranges(self, table_name: str, schema_name: str, ranges: int) -> List[Tuple[int, int]]:
+        """
+        Split a table's heap into contiguous, equal-sized ranges of pages
+        
+        The page count comes from the table's current on-disk size, so no
+        rows are read. The last range is open-ended and also covers pages
+        added after the split was planned.
+        
+        Args:
+            table_name: Name of the table
+            schema_name: Schema of the table
+            ranges: Number of ranges wanted
             
+        Returns:
+            List[Tuple[int, int]]: (first page, end page) pairs covering
+            ctid >= (first page, 0) AND ctid < (end page, 0)
+        """
+        query = """
+        SELECT pg_relation_size(c.oid) / current_setting('block_size')::int
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE c.relname = %s AND n.nspname = %s
+        """
+        
+        try:
+            pages = self._exec(query, (table_name, schema_name), fetch=True)[0][0]
+            boundaries = [pages * i // ranges for i in range(1, ranges)]
+            return list(zip([0] + boundaries, boundaries + [self._END_PAGE]))
+        except Exception as e:
+            self.logger.error(f"Failed to compute page ranges for {schema_name}.{table_name}: {e}")
+            raise
+    
+    def _estimate_row_count(self, table_name: str, schema_name: str = None,
+                            where_clause: str = "") -> Optional[int]:
+        """
+        Estimate a row count from planner statistics instead of scanning the table
+        
+        Args:
+            table_name: Name of the table
+            schema_name: Optional schema of the table
+            where_clause: Optional filter; the estimate then comes from EXPLAIN
+            
+        Returns:
+            Optional[int]: Estimated row count, or None if the table has never been analyzed
+        """
+        if where_clause:
+            plan = self._exec(
+                sql.SQL("EXPLAIN (FORMAT JSON) SELECT 1 FROM {} WHERE {}").format(
+                    self._table_identifier(table_name, schema_name),
+                    sql.SQL(where_clause)
+                ),
+                fetch=True
+            )
+            return int(plan[0][0][0]['Plan']['Plan Rows'])
+        
+        if schema_name:
+            query = """
+            SELECT reltuples::bigint, pg_relation_size(oid) FROM pg_class
+            WHERE oid = to_regclass(quote_ident(%s) || '.' || quote_ident(%s))
+            """
+            params = (schema_name, table_name)
+        else:
+            query = "SELECT reltuples::bigint, pg_relation_size(oid) FROM pg_class WHERE oid = to_regclass(quote_ident(%s))"
+            params = (table_name,)
+        
+        result = self._exec(query, params, fetch=True)
+        if not result or result[0][0] is None:
+            return None
+        estimate, relation_size = result[0]
+        # A never-analyzed table has reltuples -1 on PostgreSQL 14+, but 0
+        # before that; 0 is only trusted when the table really has no pages
+        if estimate < 0 or (estimate == 0 and relation_size > 0):
+            return None
+        return estimate
+    
+    def get_row_count(self, table_name: str, schema_name: str = None, where_clause: str = "",
+                      exact: bool = True) -> int:
+        """
+        Get total row count for a table
+        
+        Args:
+            table_name: Name of the table
+            schema_name: Optional schema of the table
+            where_clause: Optional filter condition
+            exact: If False, return the planner's estimate (pg_class.reltuples, or the
+                EXPLAIN row estimate for filtered counts) instead of running COUNT(*).
+                Falls back to COUNT(*) when the table has never been analyzed.
+        
+        The COUNT(*) runs without QUERY_TIMEOUT, as it scans the whole table.
+        Errors are raised: a failed count must not be mistaken for an empty table.
+        """
+        query = sql.SQL("SELECT COUNT(*) FROM {}").format(self._table_identifier(table_name, schema_name))
         if where_clause:
-            query += f" WHERE {where_clause}"
+            query += sql.SQL(" WHERE ") + sql.SQL(where_clause)
         
         try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    result = cursor.fetchone()
-                    return result[0]
+            if not exact:
+                estimate = self._estimate_row_count(table_name, schema_name, where_clause)
+                if estimate is not None:
+                    return estimate
+            
+            result = self._exec(query, fetch=True, timeout=False)
+            return result[0][0]
         except Exception as e:
             self.logger.error(f"Failed to get row count for table {table_name}: {e}")
-            return 0
+            raise
     
     def create_table_if_not_exists(self, table_name: str, schema_name: str, schema: List[Dict[str, Any]], 
-                                  drop_if_exists: bool = False):
-        """Create table if it doesn't exist in specified schema"""
-        # First create the schema if it doesn't exist
-        self.create_schema_if_not_exists(schema_name)
+                                  drop_if_exists: bool = False, truncate: bool = False):
+        """
+        Create table if it doesn't exist in specified schema
+        
+        Schema creation, the optional drop, the CREATE TABLE and the optional
+        truncate are sent as a single multi-statement round-trip and committed once.
         
+        Args:
+            table_name: Name of the table
+            schema_name: Schema to create the table in
+            schema: Column definitions as returned by get_table_schema
+            drop_if_exists: Whether to drop the table first if it exists
+            truncate: Whether to empty the table if it already existed
+        """
+        qualified_table = self._table_identifier(table_name, schema_name)
+        
+        # Build CREATE TABLE column list in one pass
+        columns = sql.SQL(", ").join(
+            sql.SQL("{} {}{}{}").format(
+                sql.Identifier(col['name']),
+                sql.SQL(col['type']),
+                sql.SQL("" if col['nullable'] else " NOT NULL"),
+                sql.SQL(f" DEFAULT {col['default']}" if col['default'] else "")
+            )
+            for col in schema
+        )
+        
+        statements = [sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(sql.Identifier(schema_name))]
         if drop_if_exists:
-            drop_query = f"DROP TABLE IF EXISTS {schema_name}.{table_name} CASCADE"
-            try:
-                with self.get_connection() as conn:
-                    with conn.cursor() as cursor:
-                        cursor.execute(drop_query)
-                        conn.commit()
-                self.logger.info(f"Dropped table {schema_name}.{table_name}")
-            except Exception as e:
-                self.logger.error(f"Failed to drop table {schema_name}.{table_name}: {e}")
-        
-        # Build CREATE TABLE statement
-        columns = []
-        for col in schema:
-            col_def = f"{col['name']} {col['type']}"
-            if not col['nullable']:
-                col_def += " NOT NULL"
-            if col['default']:
-                col_def += f" DEFAULT {col['default']}"
-            columns.append(col_def)
-        
-        create_query = f"""
-        CREATE TABLE IF NOT EXISTS {schema_name}.{table_name} (
-            {', '.join(columns)}
+            statements.append(sql.SQL("DROP TABLE IF EXISTS {} CASCADE").format(qualified_table))
+        statements.append(
+            sql.SQL("CREATE TABLE IF NOT EXISTS {} ({})").format(qualified_table, columns)
         )
-        """
+        if truncate:
+            statements.append(sql.SQL("TRUNCATE TABLE {}").format(qualified_table))
         
-        try:            
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(create_query)
-                    conn.commit()
+        try:
+            with self.transaction() as cursor:
+                cursor.execute(sql.SQL("; ").join(statements))
+            self.invalidate_schema_cache()
+            if drop_if_exists:
+                self.logger.info(f"Dropped table {schema_name}.{table_name}")
             self.logger.info(f"Created table {schema_name}.{table_name}")
+            if truncate:
+                self.logger.info(f"Truncated table {schema_name}.{table_name}")
         except Exception as e:
             self.logger.error(f"Failed to create table {schema_name}.{table_name}: {e}")
             raise
     
     def truncate_table(self, table_name: str, schema_name: str = None):
         """Truncate a table in the specified schema"""
-        if schema_name:
-            query = f"TRUNCATE TABLE {schema_name}.{table_name}"
-        else:
-            query = f"TRUNCATE TABLE {table_name}"
+        query = sql.SQL("TRUNCATE TABLE {}").format(self._table_identifier(table_name, schema_name))
         
         try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    conn.commit()
+            self._exec(query)
             self.logger.info(f"Truncated table {schema_name}.{table_name}" if schema_name else f"Truncated table {table_name}")
         except Exception as e:
             self.logger.error(f"Failed to truncate table {schema_name}.{table_name}" if schema_name else f"Failed to truncate table {table_name}: {e}")
             raise
     
+    def get_secondary_indexes(self, table_name: str, schema_name: str) -> List[Tuple[str, str]]:
+        """
+        Get the indexes of a table that are not unique and do not back a constraint
+        
+        Primary key, unique and exclusion constraints keep their indexes, as
+        do standalone unique indexes, so they are still enforced during a load
+        that drops the others (see drop_indexes).
+        
+        Args:
+            table_name: Name of the table
+            schema_name: Schema of the table
+        
+        Returns:
+            List[Tuple[str, str]]: (index name, CREATE INDEX statement that rebuilds it)
+        """
+        query = """
+        SELECT i.relname, pg_get_indexdef(x.indexrelid)
+        FROM pg_index x
+        JOIN pg_class i ON i.oid = x.indexrelid
+        JOIN pg_class t ON t.oid = x.indrelid
+        JOIN pg_namespace n ON n.oid = t.relnamespace
+        WHERE t.relname = %s AND n.nspname = %s
+          AND NOT x.indisunique
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = x.indexrelid)
+        """
+        
+        try:
+            return [tuple(row) for row in self._exec(query, (table_name, schema_name), fetch=True)]
+        except Exception as e:
+            self.logger.error(f"Failed to get indexes on {schema_name}.{table_name}: {e}")
+            raise
+    
+    def drop_indexes(self, index_names: List[str], schema_name: str):
+        """
+        Drop several indexes of a schema in a single statement
+        
+        Args:
+            index_names: Names of the indexes to drop
+            schema_name: Schema containing the indexes
+        """
+        if not index_names:
+            return
+        
+        try:
+            drop_query = sql.SQL("DROP INDEX IF EXISTS {}").format(
+                sql.SQL(", ").join(sql.Identifier(schema_name, index_name) for index_name in index_names)
+            )
+            self._exec(drop_query)
+            self.logger.info("Dropped %s indexes from %s", len(index_names), schema_name)
+        except Exception as e:
+            self.logger.error(f"Failed to drop indexes from {schema_name}: {e}")
+            raise
+    
+    def create_indexes(self, index_definitions: List[str], maintenance_work_mem: str = '2GB',
+                       parallel_workers: int = 4):
+        """
+        Run CREATE INDEX statements, e.g. those returned by get_secondary_indexes
+        
+        The builds get a larger sort memory and parallel workers for the
+        duration of the transaction only, and run without QUERY_TIMEOUT since
+        their run time grows with the loaded table.
+        
+        Args:
+            index_definitions: CREATE INDEX statements
+            maintenance_work_mem: maintenance_work_mem used for the builds
+            parallel_workers: max_parallel_maintenance_workers used for the builds
+        """
+        try:
+            with self.transaction(timeout=False) as cursor:
+                cursor.execute(
+                    "SELECT set_config('maintenance_work_mem', %s, true), "
+                    "set_config('max_parallel_maintenance_workers', %s, true)",
+                    (maintenance_work_mem, str(parallel_workers))
+                )
+                for index_definition in index_definitions:
+                    cursor.execute(index_definition)
+            
+            self.logger.info("Rebuilt %s indexes", len(index_definitions))
+        except Exception as e:
+            self.logger.error(f"Failed to rebuild indexes: {e}")
+            raise
+    
     def execute_query(self, query: str, params: tuple = None) -> Optional[List]:
         """Execute a query and return results"""
+        is_select = query.strip().upper().startswith('SELECT')
         try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query, params)
-                    if query.strip().upper().startswith('SELECT'):
-                        return cursor.fetchall()
-                    else:
-                        conn.commit()
-                        return None
+            result = self._exec(query, params, fetch=is_select)
+            if not is_select:
+                # The statement may have been DDL
+                self.invalidate_schema_cache()
+            return result
         except Exception as e:
             self.logger.error(f"Query execution failed: {e}")
             raise
     
     def create_temp_table_from_source(self, source_table: str, source_schema: str, 
                                     temp_table_name: str, temp_schema: str, 
-                                    offset: int, limit: int) -> bool:
+                                    start_page: int, end_page: int) -> Optional[int]:
         """
-        Create a temporary table with a subset of data from source table
+        Create a temporary table with the rows stored in a range of the source table's pages
+        
+        The range is read with a TID range scan, so each split only touches
+        its own pages instead of skipping every earlier split with OFFSET.
+        With Config.TEMP_TABLES_UNLOGGED the table is written without WAL.
         
         Args:
             source_table: Name of the source table
             source_schema: Schema of the source table
             temp_table_name: Name for the temporary table
             temp_schema: Schema for the temporary table
-            offset: Offset for data selection
-            limit: Number of rows to select
+            start_page: First heap page of the range
+            end_page: Heap page the range ends before (see get_page_ranges)
             
         Returns:
-            bool: True if successful, False otherwise
+            Optional[int]: Number of rows copied into the table, or None if it failed
         """
         try:
-            # First create the schema if it doesn't exist
-            self.create_schema_if_not_exists(temp_schema)
-            
-            # Create temporary table with data from source
-            create_query = f"""
-            CREATE TABLE {temp_schema}.{temp_table_name} AS
-            SELECT * FROM {source_schema}.{source_table}
-            ORDER BY 1  -- Order by first column for consistent pagination
-            LIMIT %s OFFSET %s
-            """
+            # The split query is identical for every split of a source table, so it
+            # is prepared once per connection and each split runs it via EXECUTE
+            split_query = sql.SQL("""
+            SELECT * FROM {}
+            WHERE ctid >= $1::tid AND ctid < $2::tid
+            """).format(self._table_identifier(source_table, source_schema))
+            source_hash = hashlib.md5(f"{source_schema}.{source_table}".encode()).hexdigest()[:16]
+            statement_name = f"etl_split_pages_{source_hash}"
+            
+            # The schema check and the CREATE TABLE AS go out as one
+            # multi-statement query, which the server runs as a single
+            # implicit transaction: one round-trip per split.
+            # An UNLOGGED table comes back empty after a server crash, which is
+            # fine for a split that is dropped after the load anyway; it is
+            # written once and never updated, so it is packed and not vacuumed
+            create_query = sql.SQL(
+                "CREATE SCHEMA IF NOT EXISTS {}; "
+                "CREATE {}TABLE {} WITH (autovacuum_enabled = false, fillfactor = 100) AS EXECUTE {}(%s, %s)"
+            ).format(
+                sql.Identifier(temp_schema),
+                sql.SQL("UNLOGGED " if Config.TEMP_TABLES_UNLOGGED else ""),
+                self._table_identifier(temp_table_name, temp_schema),
+                sql.Identifier(statement_name)
+            )
             
             with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(create_query, (limit, offset))
-                    conn.commit()
+                conn.autocommit = True
+                try:
+                    self._ensure_prepared(conn, statement_name, split_query)
+                    with conn.cursor() as cursor:
+                        try:
+                            cursor.execute(create_query, (f"({start_page},0)", f"({end_page},0)"))
+                        except psycopg2.errors.FeatureNotSupported:
+                            # The source's columns changed since the statement
+                            # was prepared on this connection
+                            self._reprepare(conn, statement_name, split_query)
+                            cursor.execute(create_query, (f"({start_page},0)", f"({end_page},0)"))
+                        # CREATE TABLE AS reports the number of rows written
+                        actual_rows = cursor.rowcount
+                finally:
+                    conn.autocommit = False
+            self.invalidate_schema_cache()
             
-            # Get the actual number of rows created
-            actual_rows = self.get_row_count(temp_table_name, temp_schema)
-            self.logger.info(f"Created temporary table {temp_schema}.{temp_table_name} with {actual_rows:,} rows")
+            self.logger.info("Created temporary table %s.%s with %s rows", temp_schema, temp_table_name, actual_rows)
             
-            return True
+            return actual_rows
             
         except Exception as e:
             self.logger.error(f"Failed to create temporary table {temp_schema}.{temp_table_name}: {e}")
-            return False
+            return None
     
     def drop_table(self, table_name: str, schema_name: str) -> bool:
         """
@@ -265,23 +792,85 @@ class DatabaseManager:
             bool: True if successful, False otherwise
         """
         try:
-            drop_query = f"DROP TABLE IF EXISTS {schema_name}.{table_name} CASCADE"
-            
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(drop_query)
-                    conn.commit()
+            drop_query = sql.SQL("DROP TABLE IF EXISTS {} CASCADE").format(
+                self._table_identifier(table_name, schema_name)
+            )
+            self._exec(drop_query)
+            self.invalidate_schema_cache()
             
-            self.logger.info(f"Dropped table {schema_name}.{table_name}")
+            self.logger.info("Dropped table %s.%s", schema_name, table_name)
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to drop table {schema_name}.{table_name}: {e}")
             return False
     
+    def drop_tables(self, table_names: List[str], schema_name: str) -> bool:
+        """
+        Drop several tables from the specified schema in a single statement
+        
+        Args:
+            table_names: Names of the tables to drop
+            schema_name: Schema containing the tables
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not table_names:
+            return True
+        
+        try:
+            drop_query = sql.SQL("DROP TABLE IF EXISTS {} CASCADE").format(
+                sql.SQL(", ").join(self._table_identifier(table_name, schema_name) for table_name in table_names)
+            )
+            self._exec(drop_query)
+            self.invalidate_schema_cache()
+            
+            self.logger.info("Dropped %s tables from %s", len(table_names), schema_name)
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to drop tables from {schema_name}: {e}")
+            return False
+    
+    def drop_tables_matching(self, schema_name: str, pattern: str) -> bool:
+        """
+        Drop every table of a schema whose name matches a LIKE pattern
+        
+        The tables are looked up and dropped on the server in one round-trip.
+        
+        Args:
+            schema_name: Schema containing the tables
+            pattern: LIKE pattern for the table names (e.g., 'event_plan_member_%')
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        drop_query = """
+        DO $$
+        DECLARE
+            r record;
+        BEGIN
+            FOR r IN SELECT tablename FROM pg_tables WHERE schemaname = %s AND tablename LIKE %s LOOP
+                EXECUTE format('DROP TABLE IF EXISTS %%I.%%I CASCADE', %s, r.tablename);
+            END LOOP;
+        END $$
+        """
+        
+        try:
+            self._exec(drop_query, (schema_name, pattern, schema_name))
+            self.invalidate_schema_cache()
+            
+            self.logger.info("Dropped tables matching %s from %s", pattern, schema_name)
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to drop tables matching {pattern} from {schema_name}: {e}")
+            return False
+    
     def get_table_names_in_schema(self, schema_name: str, pattern: str = None) -> List[str]:
         """
-        Get list of table names in a schema
+        Get list of table names in a schema (cached for Config.SCHEMA_CACHE_TTL seconds)
         
         Args:
             schema_name: Name of the schema
@@ -290,6 +879,11 @@ class DatabaseManager:
         Returns:
             List[str]: List of table names
         """
+        cache_key = ('table_names', schema_name, pattern)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             if pattern:
                 query = """
@@ -308,54 +902,232 @@ class DatabaseManager:
                 """
                 params = (schema_name,)
             
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query, params)
-                    tables = cursor.fetchall()
-                    return [table[0] for table in tables]
+            tables = self._exec(query, params, fetch=True)
+            table_names = [table[0] for table in tables]
+            
+            self._set_cached(cache_key, table_names)
+            return table_names
                     
         except Exception as e:
             self.logger.error(f"Failed to get table names in schema {schema_name}: {e}")
             return []
     
-    def extract_from_temp_table(self, temp_table_name: str, temp_schema: str, 
-                              offset: int, limit: int) -> pd.DataFrame:
+    def copy_query_to_buffer(self, query, params: tuple = None) -> io.BytesIO:
         """
-        Extract data from a temporary table using offset and limit
+        Run a SELECT through COPY ... TO STDOUT into an in-memory CSV buffer
+        
+        The buffer holds a header line and PostgreSQL's text representation of
+        every value, with NULL written as \\N. It can be parsed with
+        copy_query_to_dataframe or loaded as-is with copy_buffer_to_table.
         
         Args:
-            temp_table_name: Name of the temporary table
-            temp_schema: Schema of the temporary table
-            offset: Offset for data selection
-            limit: Number of rows to select
+            query: SELECT statement (string or psycopg2.sql composable) using %s placeholders
+            params: Optional query parameters
             
         Returns:
-            pd.DataFrame: DataFrame containing the extracted data
+            io.BytesIO: CSV buffer positioned at its start
         """
-        query = f"""
-        SELECT * FROM {temp_schema}.{temp_table_name}
-        ORDER BY 1  -- Order by first column for consistent pagination
-        LIMIT %s OFFSET %s
+        buffer = io.BytesIO()
+        
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                select_sql = cursor.mogrify(query, params).decode()
+                cursor.copy_expert(
+                    f"COPY ({select_sql}) TO STDOUT WITH (FORMAT CSV, HEADER, NULL '\\N')",
+                    buffer
+                )
+        
+        buffer.seek(0)
+        return buffer
+    
+    def copy_buffer_to_table(self, buffer, table_name: str, schema_name: str, columns: List[str]) -> int:
+        """
+        Append a CSV buffer (header line, NULL written as \\N) to a table with COPY ... FROM STDIN
+        
+        Args:
+            buffer: Readable file-like object, e.g. from copy_query_to_buffer
+            table_name: Name of the target table
+            schema_name: Schema of the target table
+            columns: Target columns, in the order of the buffer's fields
+            
+        Returns:
+            int: Number of rows loaded
+        """
+        query = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT CSV, HEADER, NULL '\\N')").format(
+            self._table_identifier(table_name, schema_name),
+            sql.SQL(", ").join(map(sql.Identifier, columns))
+        )
+        
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.copy_expert(query.as_string(conn), buffer)
+                rows_loaded = cursor.rowcount
+            conn.commit()
+        return rows_loaded
+    
+    def copy_query_to_dataframe(self, query, params: tuple = None,
+                                chunksize: int = None) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Run a SELECT through COPY ... TO STDOUT and read the result into a DataFrame
+        
+        COPY streams the result in bulk instead of building a Python tuple per
+        row, and pandas parses the CSV in C. All values are kept as strings in
+        PostgreSQL's text representation (NULL becomes NaN, empty strings are
+        preserved), which PostgreSQL casts back to the column types on load.
+        
+        Args:
+            query: SELECT statement (string or psycopg2.sql composable) using %s placeholders
+            params: Optional query parameters
+            chunksize: If given, parse the result lazily and return an iterator
+                of DataFrames with at most chunksize rows each
+            
+        Returns:
+            Union[pd.DataFrame, Iterator[pd.DataFrame]]: The query result, or an
+            iterator over it when chunksize is given
+        """
+        return pd.read_csv(
+            self.copy_query_to_buffer(query, params),
+            dtype=str,
+            keep_default_na=False,
+            na_values=['\\N'],
+            chunksize=chunksize
+        )
+    
+    def bulk_load(self, df: pd.DataFrame, table_name: str, schema_name: str = None) -> int:
         """
+        Append a DataFrame to a table with COPY ... FROM STDIN
+        
+        The frame is serialized to CSV in memory and sent in one COPY, which
+        avoids per-row INSERT parsing and planning. Columns are matched by
+        name, NULLs are written as \\N (empty strings stay empty strings) and
+        PostgreSQL casts the text back to the column types. The frame is
+        expected to be cleaned already (JSON values serialized as strings).
+        
+        Args:
+            df: Rows to load
+            table_name: Name of the target table
+            schema_name: Schema of the target table
+            
+        Returns:
+            int: Number of rows loaded
+        """
+        if df.empty:
+            return 0
+        
+        # Integer columns holding NULLs arrive as float64; write them without
+        # a trailing ".0" so PostgreSQL accepts them. Only columns that are
+        # integers in the table are cast: whole values of a float column
+        # stay floats (and may not fit in an int64)
+        integer_columns = {
+            col['name'] for col in self.get_table_schema(table_name, schema_name)
+            if col['type'] in ('smallint', 'integer', 'bigint')
+        }
+        integral_columns = [
+            column for column in df.columns
+            if column in integer_columns and pd.api.types.is_float_dtype(df[column])
+        ]
+        if integral_columns:
+            df = df.astype({column: 'Int64' for column in integral_columns})
+        
+        # bytea values arrive as memoryview (or bytes), which to_csv would
+        # write as their repr; write them in PostgreSQL's hex format instead
+        binary_columns = {}
+        for column in df.columns:
+            if df[column].dtype == object:
+                first = df[column].first_valid_index()
+                if first is not None and isinstance(df[column].loc[first], (bytes, bytearray, memoryview)):
+                    binary_columns[column] = df[column].map(
+                        lambda value: '\\x' + value.hex() if isinstance(value, (bytes, bytearray, memoryview)) else value
+                    )
+        if binary_columns:
+            df = df.assign(**binary_columns)
+        
+        buffer = io.StringIO()
+        df.to_csv(buffer, index=False, na_rep='\\N')
+        buffer.seek(0)
         
         try:
-            engine = self.get_engine()
-            df = pd.read_sql(
-                query, 
-                engine, 
-                params=(limit, offset),
-                chunksize=Config.CHUNK_SIZE
-            )
+            return self.copy_buffer_to_table(buffer, table_name, schema_name, list(df.columns))
+        except Exception as e:
+            self.logger.error(f"Failed to bulk load {len(df):,} rows into {schema_name}.{table_name}: {e}")
+            raise
+    
+    def insert_values(self, df: pd.DataFrame, table_name: str, schema_name: str = None,
+                      page_size: int = 1000) -> int:
+        """
+        Append a DataFrame to a table with multi-row INSERTs built by psycopg2
+        
+        Uses psycopg2.extras.execute_values, which renders page_size rows into
+        each INSERT ... VALUES statement in C. NaN/NaT become NULL and numpy
+        scalars are converted to plain Python values first.
+        
+        Args:
+            df: Rows to load
+            table_name: Name of the target table
+            schema_name: Schema of the target table
+            page_size: Number of rows per INSERT statement
             
-            # If chunksize is used, read all chunks
-            if hasattr(df, '__iter__'):
-                chunks = []
-                for chunk in df:
-                    chunks.append(chunk)
-                df = pd.concat(chunks, ignore_index=True)
+        Returns:
+            int: Number of rows inserted
+        """
+        if df.empty:
+            return 0
+        
+        values = df.astype(object).where(df.notna(), None)
+        query = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
+            self._table_identifier(table_name, schema_name),
+            sql.SQL(", ").join(map(sql.Identifier, df.columns))
+        )
+        
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    psycopg2.extras.execute_values(
+                        cursor,
+                        query.as_string(conn),
+                        zip(*(values[column].values for column in values.columns)),
+                        page_size=page_size
+                    )
+                conn.commit()
+            return len(df)
+        except Exception as e:
+            self.logger.error(f"Failed to insert {len(df):,} rows into {schema_name}.{table_name}: {e}")
+            raise
+    
+    def stream_source(self, source_table: str, source_schema: str, batch_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Stream a table in batches through a server-side (named) cursor
+        
+        The whole table is read in a single pass in physical order: PostgreSQL
+        keeps the cursor open and hands out batch_size rows per FETCH, so
+        nothing is sorted, skipped with OFFSET or materialized into a staging
+        table. The cursor's snapshot keeps the batches consistent. The pooled
+        connection is held until the generator is exhausted or closed.
+        
+        Args:
+            source_table: Name of the table to read
+            source_schema: Schema of the table to read
+            batch_size: Number of rows per yielded DataFrame
             
-            return df
-                
+        Yields:
+            pd.DataFrame: The next batch of rows
+        """
+        query = sql.SQL("SELECT * FROM {}").format(
+            self._table_identifier(source_table, source_schema)
+        )
+        
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor(name='etl_stream') as cursor:
+                    cursor.itersize = batch_size
+                    cursor.execute(query)
+                    
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        yield pd.DataFrame(rows, columns=[column.name for column in cursor.description])
+                        
         except Exception as e:
-            self.logger.error(f"Failed to extract from temp table {temp_schema}.{temp_table_name} (offset={offset}, limit={limit}): {e}")
-            raise 
\ No newline at end of file
+            self.logger.error(f"Failed to stream {source_schema}.{source_table}: {e}")
+            raise
@@ -1,14 +1,21 @@
 import pandas as pd
+import io
+import os
 import logging
 import time
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Callable, Union
 from tqdm import tqdm
 import psycopg2
+from psycopg2 import sql
 from sqlalchemy import text
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+import multiprocessing
+import queue
+import itertools
 import json
+import uuid
+import orjson
 import numpy as np
 
 from config import Config
@@ -23,10 +30,19 @@ class ETLTransfer:
         )
         self.target_db = DatabaseManager(
             Config.get_target_connection_string(),
-            Config.CONNECTION_TIMEOUT
+            Config.CONNECTION_TIMEOUT,
+            synchronous_commit=Config.SYNCHRONOUS_COMMIT
         )
         self.logger = self._setup_logging()
-        self.lock = threading.Lock()
+        self.key_column = None
+        # Per-column converters for batches of Python objects, from the source schema
+        self._col_converters: Dict[str, Callable[[pd.Series], pd.Series]] = {}
+        self._source_columns: List[str] = []
+        self._binary_copy = False
+        # Run id of the split transfer checkpoint, if any (see _save_checkpoint)
+        self._checkpoint_run_id: Optional[str] = None
+        self._deferred_indexes: List[str] = []
+        self._total_rows: Optional[int] = None
         
     def _setup_logging(self) -> logging.Logger:
         """Setup logging configuration"""
@@ -50,57 +66,74 @@ class ETLTransfer:
         
         return logger
     
+    @staticmethod
+    def _to_json(value: Any) -> Any:
+        """Serialize dict/list/numpy array values to JSON strings, leaving other values untouched"""
+        try:
+            if isinstance(value, (dict, list)):
+                return orjson.dumps(value).decode()
+            if isinstance(value, np.ndarray):
+                # orjson serializes numeric arrays directly; object arrays go through a list
+                if value.dtype == object:
+                    return orjson.dumps(value.tolist()).decode()
+                return orjson.dumps(np.ascontiguousarray(value), option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects some values the json module accepts, e.g. string
+            # or float16 arrays, non-string dict keys and integers over 64 bits
+            return json.dumps(value.tolist() if isinstance(value, np.ndarray) else value)
+        return value
+    
+    @classmethod
+    def _json_column(cls, series: pd.Series) -> pd.Series:
+        """Serialize the dict/list/array values of a JSON column"""
+        return series.map(cls._to_json)
+    
+    @staticmethod
+    def _naive_datetime_column(series: pd.Series) -> pd.Series:
+        """Drop the timezone of a timezone-aware datetime column"""
+        if isinstance(series.dtype, pd.DatetimeTZDtype):
+            return series.dt.tz_localize(None)
+        return series
+    
+    def _build_column_converters(self, schema: List[Dict[str, Any]]) -> Dict[str, Callable[[pd.Series], pd.Series]]:
+        """
+        Pick a converter for every source column that needs one, from its SQL type
+        
+        Args:
+            schema: Source schema as returned by get_source_schema
+            
+        Returns:
+            Dict[str, Callable[[pd.Series], pd.Series]]: Converter per column name
+        """
+        converters = {}
+        for col in schema:
+            if col['type'] in ('json', 'jsonb', 'ARRAY'):
+                converters[col['name']] = self._json_column
+            elif col['type'] == 'timestamp with time zone':
+                converters[col['name']] = self._naive_datetime_column
+        return converters
+    
     def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and convert data types for PostgreSQL compatibility"""
+        """
+        Clean and convert data types for PostgreSQL compatibility
+        
+        Applies the converters picked once from the source schema (see
+        _build_column_converters): JSON and array columns get their dict/list
+        values serialized, timestamptz columns are made timezone-naive. Only
+        needed for batches of Python objects; COPY-extracted batches are
+        already PostgreSQL text.
+        
+        The frame is modified in place (only converted columns are reassigned)
+        and returned; callers hand it straight to load_batch.
+        """
         if df.empty:
             return df
         
-        df_clean = df.copy()
-        
-        for column in df_clean.columns:
-            # Handle dictionary/JSON objects
-            if df_clean[column].dtype == 'object':
-                # Check if column contains dictionaries
-                dict_mask = df_clean[column].apply(lambda x: isinstance(x, dict) if pd.notna(x) else False)
-                if dict_mask.any():
-                    # Convert dictionaries to JSON strings
-                    df_clean[column] = df_clean[column].apply(
-                        lambda x: json.dumps(x) if isinstance(x, dict) and pd.notna(x) else x
-                    )
-                    self.logger.debug(f"Converted dictionary column '{column}' to JSON strings")
-                
-                # Handle numpy arrays
-                array_mask = df_clean[column].apply(lambda x: isinstance(x, np.ndarray) if pd.notna(x) else False)
-                if array_mask.any():
-                    # Convert numpy arrays to lists then to JSON
-                    df_clean[column] = df_clean[column].apply(
-                        lambda x: json.dumps(x.tolist()) if isinstance(x, np.ndarray) and pd.notna(x) else x
-                    )
-                    self.logger.debug(f"Converted numpy array column '{column}' to JSON strings")
-                
-                # Handle lists
-                list_mask = df_clean[column].apply(lambda x: isinstance(x, list) if pd.notna(x) else False)
-                if list_mask.any():
-                    # Convert lists to JSON strings
-                    df_clean[column] = df_clean[column].apply(
-                        lambda x: json.dumps(x) if isinstance(x, list) and pd.notna(x) else x
-                    )
-                    self.logger.debug(f"Converted list column '{column}' to JSON strings")
-            
-            # Handle numpy data types
-            elif df_clean[column].dtype == np.int64:
-                df_clean[column] = df_clean[column].astype('int64')
-            elif df_clean[column].dtype == np.float64:
-                df_clean[column] = df_clean[column].astype('float64')
-            elif df_clean[column].dtype == np.bool_:
-                df_clean[column] = df_clean[column].astype('bool')
-            
-            # Handle datetime with timezone issues
-            elif pd.api.types.is_datetime64_any_dtype(df_clean[column]):
-                # Convert to timezone-naive datetime if needed
-                df_clean[column] = pd.to_datetime(df_clean[column]).dt.tz_localize(None)
-        
-        return df_clean
+        for column, convert in self._col_converters.items():
+            if column in df.columns:
+                df[column] = convert(df[column])
+        
+        return df
     
     def validate_connections(self) -> bool:
         """Validate both source and target database connections"""
@@ -120,6 +153,20 @@ class ETLTransfer:
         self.logger.info("Database connections validated successfully")
         return True
     
+    def ping(self) -> bool:
+        """
+        Check the pooled connections of a reused instance before a run
+        
+        A pool whose connections were dropped while idle is reset by the
+        first ping, and the second ping checks a freshly opened connection.
+        
+        Returns:
+            bool: True if both databases are reachable, False otherwise
+        """
+        source_ok = self.source_db.ping() or self.source_db.ping()
+        target_ok = self.target_db.ping() or self.target_db.ping()
+        return source_ok and target_ok
+    
     def get_source_schema(self) -> List[Dict[str, Any]]:
         """Get source table schema"""
         self.logger.info(f"Getting schema for source table: {Config.SOURCE_TABLE}")
@@ -129,11 +176,24 @@ class ETLTransfer:
             raise ValueError(f"Could not retrieve schema for table {Config.SOURCE_TABLE}")
         
         self.logger.info(f"Retrieved schema with {len(schema)} columns")
+        self._apply_source_schema(schema)
         return schema
     
+    def _apply_source_schema(self, schema: List[Dict[str, Any]]):
+        """Derive the per-column converters and the column list from the source schema"""
+        self._col_converters = self._build_column_converters(schema)
+        self._source_columns = [col['name'] for col in schema]
+    
     def prepare_target_table(self, schema: List[Dict[str, Any]], 
-                           drop_if_exists: bool = False):
-        """Prepare target table with same schema as source in ETL schema"""
+                           drop_if_exists: bool = False, truncate: bool = False):
+        """
+        Prepare target table with same schema as source in ETL schema
+        
+        Secondary indexes of an existing target table are dropped so the load
+        does not maintain them row by row; finalize_target_table rebuilds them.
+        Their definitions are also saved to Config.INDEX_BACKUP_PATH, so indexes
+        dropped by a run that crashed are rebuilt by the next one.
+        """
         self.logger.info(f"Preparing target table: {Config.TARGET_SCHEMA}.{Config.TARGET_TABLE}")
         
         try:
@@ -141,52 +201,212 @@ class ETLTransfer:
                 Config.TARGET_TABLE, 
                 Config.TARGET_SCHEMA,
                 schema, 
-                drop_if_exists
+                drop_if_exists,
+                truncate
             )
+            index_file = Config.INDEX_BACKUP_PATH
+            target = f"{Config.TARGET_SCHEMA}.{Config.TARGET_TABLE}"
+            if drop_if_exists:
+                # The indexes of a crashed run went away with the old table
+                if os.path.exists(index_file):
+                    os.remove(index_file)
+            else:
+                index_definitions = []
+                if os.path.exists(index_file):
+                    with open(index_file) as f:
+                        backup = json.load(f)
+                    if backup['target'] == target:
+                        index_definitions = backup['indexes']
+                        self.logger.info(f"Restoring {len(index_definitions)} index definitions saved by an earlier run")
+                    else:
+                        self.logger.warning(f"Discarding {index_file}, saved for {backup['target']}: {backup['indexes']}")
+                secondary_indexes = self.target_db.get_secondary_indexes(Config.TARGET_TABLE, Config.TARGET_SCHEMA)
+                for _, index_definition in secondary_indexes:
+                    if index_definition not in index_definitions:
+                        index_definitions.append(index_definition)
+                # The definitions are saved before the indexes are dropped, so
+                # a crash in between cannot lose them
+                if index_definitions:
+                    temp_path = f"{index_file}.tmp"
+                    with open(temp_path, 'w') as f:
+                        json.dump({'target': target, 'indexes': index_definitions}, f, indent=2)
+                    os.replace(temp_path, index_file)
+                self.target_db.drop_indexes([index_name for index_name, _ in secondary_indexes], Config.TARGET_SCHEMA)
+                self._deferred_indexes = index_definitions
             self.logger.info("Target table prepared successfully")
         except Exception as e:
             self.logger.error(f"Failed to prepare target table: {e}")
             raise
     
-    def get_total_rows(self) -> int:
-        """Get total number of rows in source table"""
+    def finalize_target_table(self):
+        """Rebuild the target indexes dropped by prepare_target_table, after the load"""
+        index_definitions, self._deferred_indexes = self._deferred_indexes, []
+        if index_definitions:
+            self.logger.info(f"Rebuilding {len(index_definitions)} indexes on {Config.TARGET_SCHEMA}.{Config.TARGET_TABLE}")
+            self.target_db.create_indexes(index_definitions)
+            os.remove(Config.INDEX_BACKUP_PATH)
+    
+    def get_target_row_count(self, rows_transferred: int, verify: bool) -> Tuple[int, bool]:
+        """
+        Get the target row count, counting the target table only when needed
+        
+        The target was emptied before the load and every load reports the
+        rows it committed, so after a clean run the target holds exactly
+        rows_transferred rows and the COUNT(*) scan can be skipped.
+        
+        Args:
+            rows_transferred: Rows reported loaded by the batches
+            verify: Count the table anyway (e.g. because some batches failed)
+            
+        Returns:
+            Tuple[int, bool]: Target row count and whether it was counted with COUNT(*)
+        """
+        if not verify:
+            return rows_transferred, False
+        return self.target_db.get_row_count(Config.TARGET_TABLE, Config.TARGET_SCHEMA), True
+    
+    def get_total_rows(self, refresh: bool = False) -> int:
+        """
+        Get total number of rows in source table
+        
+        The COUNT(*) runs once per instance; later calls reuse its result.
+        
+        Args:
+            refresh: Count the source table again instead of using the cached count
+        """
+        if self._total_rows is not None and not refresh:
+            return self._total_rows
+        
         self.logger.info("Getting total row count from source table...")
-        total_rows = self.source_db.get_row_count(Config.SOURCE_TABLE, Config.SOURCE_SCHEMA)
-        self.logger.info(f"Total rows in source table: {total_rows:,}")
+        self._total_rows = self.source_db.get_row_count(Config.SOURCE_TABLE, Config.SOURCE_SCHEMA)
+        self.logger.info(f"Total rows in source table: {self._total_rows:,}")
+        return self._total_rows
+    
+    def get_estimated_total_rows(self) -> int:
+        """
+        Estimate the number of rows in source table from planner statistics
+        
+        Cheap enough for sizing and smoke tests on large tables; falls back to
+        COUNT(*) if the source table has never been analyzed.
+        """
+        total_rows = self.source_db.get_row_count(Config.SOURCE_TABLE, Config.SOURCE_SCHEMA, exact=False)
+        self.logger.info(f"Estimated rows in source table: {total_rows:,}")
         return total_rows
     
-    def extract_batch(self, offset: int, limit: int) -> pd.DataFrame:
-        """Extract a batch of data from source table"""
-        query = f"""
-        SELECT * FROM {Config.SOURCE_TABLE}
-        ORDER BY 1  -- Order by first column for consistent pagination
-        LIMIT %s OFFSET %s
+    def _key_page_query(self, lower: Any, upper: Any, last_key: Any, limit: int) -> Tuple[sql.Composed, tuple]:
         """
+        Build the keyset query for the next page of a key range
         
-        try:
-            engine = self.source_db.get_engine()
-            df = pd.read_sql(
-                query, 
-                engine, 
-                params=(limit, offset),
-                chunksize=Config.CHUNK_SIZE
-            )
+        Args:
+            lower: Inclusive lower bound of the key range (None for unbounded)
+            upper: Exclusive upper bound of the key range (None for unbounded)
+            last_key: Key of the last row of the previous page (None for the first page)
+            limit: Maximum number of rows in the page
             
-            # If chunksize is used, read all chunks
-            if hasattr(df, '__iter__'):
-                chunks = []
-                for chunk in df:
-                    chunks.append(chunk)
-                df = pd.concat(chunks, ignore_index=True)
+        Returns:
+            Tuple[sql.Composed, tuple]: Query and its parameters
+        """
+        key = sql.Identifier(self.key_column)
+        conditions = []
+        params = []
+        
+        if last_key is not None:
+            conditions.append(sql.SQL("{} > %s").format(key))
+            params.append(last_key)
+        elif lower is not None:
+            conditions.append(sql.SQL("{} >= %s").format(key))
+            params.append(lower)
+        if upper is not None:
+            conditions.append(sql.SQL("{} < %s").format(key))
+            params.append(upper)
+        
+        query = sql.SQL("SELECT * FROM {} {} ORDER BY {} LIMIT %s").format(
+            sql.Identifier(Config.SOURCE_SCHEMA, Config.SOURCE_TABLE),
+            sql.SQL("WHERE ") + sql.SQL(" AND ").join(conditions) if conditions else sql.SQL(""),
+            key
+        )
+        params.append(limit)
+        return query, tuple(params)
+    
+    def extract_batch(self, lower: Any, upper: Any, last_key: Any, limit: int) -> Iterator[pd.DataFrame]:
+        """
+        Extract the next batch of a key range from the source table
+        
+        Uses keyset pagination on self.key_column (the source primary key), so
+        every batch is an index range scan that starts where the previous one
+        ended rather than re-sorting and skipping an OFFSET. The batch is
+        parsed lazily in chunks of Config.CHUNK_SIZE rows, so no DataFrame
+        larger than one chunk is materialized.
+        
+        Args:
+            lower: Inclusive lower bound of the key range (None for unbounded)
+            upper: Exclusive upper bound of the key range (None for unbounded)
+            last_key: Key of the last row of the previous batch (None for the first batch)
+            limit: Maximum number of rows to extract
             
-            # Clean the dataframe before returning
-            df_clean = self._clean_dataframe(df)
-            return df_clean
-                
+        Returns:
+            Iterator[pd.DataFrame]: The raw batch, chunk by chunk, in key order
+        """
+        query, params = self._key_page_query(lower, upper, last_key, limit)
+        
+        try:
+            return self.source_db.copy_query_to_dataframe(query, params, chunksize=Config.CHUNK_SIZE)
+        except Exception as e:
+            self.logger.error(f"Failed to extract batch (range=[{lower}, {upper}), last_key={last_key}): {e}")
+            raise
+    
+    def extract_batch_csv(self, lower: Any, upper: Any, last_key: Any, limit: int) -> Tuple[io.BytesIO, int, Any]:
+        """
+        Extract the next batch of a key range as raw COPY CSV, without building a DataFrame
+        
+        Same keyset query as extract_batch. Only the key column is parsed (to
+        find where the next batch starts); the buffer itself is loaded into
+        the target unchanged by process_csv_batch.
+        
+        Args:
+            lower: Inclusive lower bound of the key range (None for unbounded)
+            upper: Exclusive upper bound of the key range (None for unbounded)
+            last_key: Key of the last row of the previous batch (None for the first batch)
+            limit: Maximum number of rows to extract
+            
+        Returns:
+            Tuple[io.BytesIO, int, Any]: CSV buffer, number of rows in it and
+            the key of its last row
+        """
+        query, params = self._key_page_query(lower, upper, last_key, limit)
+        
+        try:
+            buffer = self.source_db.copy_query_to_buffer(query, params)
+            keys = pd.read_csv(
+                buffer,
+                usecols=[self.key_column],
+                dtype=str,
+                keep_default_na=False,
+                na_values=['\\N']
+            )[self.key_column]
+            buffer.seek(0)
+            return buffer, len(keys), keys.iloc[-1] if len(keys) else last_key
         except Exception as e:
-            self.logger.error(f"Failed to extract batch (offset={offset}, limit={limit}): {e}")
+            self.logger.error(f"Failed to extract batch (range=[{lower}, {upper}), last_key={last_key}): {e}")
             raise
     
+    def extract_batches(self) -> Iterator[pd.DataFrame]:
+        """
+        Stream the source table in batches of Config.BATCH_SIZE rows (at most Config.CHUNK_SIZE)
+        
+        The table is read in one unordered pass over a server-side cursor
+        (see DatabaseManager.stream_source) instead of one ORDER BY +
+        LIMIT/OFFSET query per batch.
+        
+        Used when the source has no single-column primary key to split on.
+        
+        Yields:
+            pd.DataFrame: The next raw batch (cleaned later in process_batch)
+        """
+        return self.source_db.stream_source(
+            Config.SOURCE_TABLE, Config.SOURCE_SCHEMA, min(Config.BATCH_SIZE, Config.CHUNK_SIZE)
+        )
+    
     def load_batch(self, df: pd.DataFrame, batch_number: int) -> bool:
         """Load a batch of data to target table in ETL schema"""
         if df.empty:
@@ -194,20 +414,17 @@ class ETLTransfer:
             return True
         
         try:
-            engine = self.target_db.get_engine()
-            
-            # Use to_sql with schema specification for batch loading
-            df.to_sql(
-                Config.TARGET_TABLE,
-                engine,
-                schema=Config.TARGET_SCHEMA,
-                if_exists='append',
-                index=False,
-                method='multi',  # Use multi-row insert for better performance
-                chunksize=1000   # Internal chunk size for to_sql
-            )
+            if Config.USE_COPY:
+                # Stream the batch in with COPY FROM STDIN
+                self.target_db.bulk_load(df, Config.TARGET_TABLE, Config.TARGET_SCHEMA)
+            else:
+                # Multi-row INSERTs rendered by psycopg2's execute_values
+                self.target_db.insert_values(
+                    df, Config.TARGET_TABLE, Config.TARGET_SCHEMA, page_size=Config.INSERT_PAGE_SIZE
+                )
             
-            self.logger.debug(f"Successfully loaded batch {batch_number} with {len(df):,} rows to {Config.TARGET_SCHEMA}.{Config.TARGET_TABLE}")
+            self.logger.debug("Successfully loaded batch %s with %s rows to %s.%s",
+                              batch_number, len(df), Config.TARGET_SCHEMA, Config.TARGET_TABLE)
             return True
             
         except Exception as e:
@@ -226,15 +443,19 @@ class ETLTransfer:
             
             return False
     
-    def process_batch(self, batch_number: int, offset: int, limit: int) -> Dict[str, Any]:
-        """Process a single batch (extract and load)"""
+    def process_batch(self, batch_number: int, df: pd.DataFrame, clean: bool = True) -> Dict[str, Any]:
+        """
+        Process a single extracted batch (clean and load)
+        
+        Args:
+            batch_number: Batch number for logging
+            df: Extracted batch
+            clean: Whether to run _clean_dataframe first (not needed for
+                COPY-extracted text)
+        """
         start_time = time.time()
         
         try:
-            # Extract batch
-            self.logger.debug(f"Extracting batch {batch_number} (offset={offset}, limit={limit})")
-            df = self.extract_batch(offset, limit)
-            
             if df.empty:
                 return {
                     'batch_number': batch_number,
@@ -244,8 +465,10 @@ class ETLTransfer:
                     'error': None
                 }
             
-            # Load batch
-            self.logger.debug(f"Loading batch {batch_number} with {len(df):,} rows")
+            # Clean and load batch
+            self.logger.debug("Loading batch %s with %s rows", batch_number, len(df))
+            if clean:
+                df = self._clean_dataframe(df)
             success = self.load_batch(df, batch_number)
             
             return {
@@ -266,8 +489,125 @@ class ETLTransfer:
                 'error': str(e)
             }
     
+    def process_csv_batch(self, batch_number: int, buffer: io.BytesIO) -> Dict[str, Any]:
+        """
+        Load a raw COPY CSV batch (from extract_batch_csv) into the target table as-is
+        
+        Args:
+            batch_number: Batch number for logging
+            buffer: CSV buffer with a header line
+            
+        Returns:
+            Dict[str, Any]: Batch processing results
+        """
+        start_time = time.time()
+        
+        try:
+            rows_loaded = self.target_db.copy_buffer_to_table(
+                buffer, Config.TARGET_TABLE, Config.TARGET_SCHEMA, self._source_columns
+            )
+            self.logger.debug("Successfully loaded batch %s with %s rows to %s.%s",
+                              batch_number, rows_loaded, Config.TARGET_SCHEMA, Config.TARGET_TABLE)
+            return {
+                'batch_number': batch_number,
+                'rows_processed': rows_loaded,
+                'success': True,
+                'duration': time.time() - start_time,
+                'error': None
+            }
+        except Exception as e:
+            self.logger.error(f"Batch {batch_number} processing failed: {e}")
+            return {
+                'batch_number': batch_number,
+                'rows_processed': 0,
+                'success': False,
+                'duration': time.time() - start_time,
+                'error': str(e)
+            }
+    
+    def _process_chunk(self, batch_number: Any, chunk: Union[pd.DataFrame, io.BytesIO]) -> Dict[str, Any]:
+        """Load a key-range chunk produced by iter_key_range"""
+        if isinstance(chunk, pd.DataFrame):
+            return self.process_batch(batch_number, chunk, clean=False)
+        return self.process_csv_batch(batch_number, chunk)
+    
+    def iter_key_range(self, lower: Any, upper: Any, as_csv: bool = False) -> Iterator[Union[pd.DataFrame, io.BytesIO]]:
+        """
+        Extract one key range as a stream of chunks
+        
+        Pages of Config.BATCH_SIZE rows are read with keyset pagination, each
+        parsed lazily in chunks of Config.CHUNK_SIZE rows (see extract_batch),
+        or passed on as one raw CSV buffer per page (see extract_batch_csv).
+        
+        Args:
+            lower: Inclusive lower bound of the key range (None for unbounded)
+            upper: Exclusive upper bound of the key range (None for unbounded)
+            as_csv: Whether to yield raw CSV buffers instead of DataFrames
+            
+        Yields:
+            Union[pd.DataFrame, io.BytesIO]: The next chunk of the range, in key order
+        """
+        last_key = None
+        
+        while True:
+            if as_csv:
+                buffer, rows_extracted, last_key = self.extract_batch_csv(lower, upper, last_key, Config.BATCH_SIZE)
+                if rows_extracted:
+                    yield buffer
+                if rows_extracted < Config.BATCH_SIZE:
+                    return
+                continue
+            
+            rows_extracted = 0
+            for chunk in self.extract_batch(lower, upper, last_key, Config.BATCH_SIZE):
+                if chunk.empty:
+                    continue
+                rows_extracted += len(chunk)
+                last_key = chunk[self.key_column].iloc[-1]
+                yield chunk
+            
+            if rows_extracted < Config.BATCH_SIZE:
+                return
+    
+    def _extraction_failure(self, batch_number: Any, lower: Any, upper: Any, error: Exception) -> Dict[str, Any]:
+        """Build the batch result reported when a key range cannot be extracted any further"""
+        self.logger.error(f"Extraction failed for key range [{lower}, {upper}): {error}")
+        return {
+            'batch_number': batch_number,
+            'rows_processed': 0,
+            'success': False,
+            'duration': 0,
+            'error': f"Extraction failed, key range [{lower}, {upper}) abandoned: {error}"
+        }
+    
+    def process_key_range(self, lower: Any, upper: Any, record: Callable[[Any, Dict[str, Any]], None]):
+        """
+        Extract and load one key range chunk by chunk on the calling thread
+        
+        COPY-extracted text needs no cleaning, so chunks are loaded as they
+        are (with USE_COPY, as raw CSV that never becomes a DataFrame). A
+        failed load is reported and skipped; a failed extraction abandons the
+        rest of the range, since it can only be located from the last key
+        that was read.
+        
+        Args:
+            lower: Inclusive lower bound of the key range (None for unbounded)
+            upper: Exclusive upper bound of the key range (None for unbounded)
+            record: Called with (batch_number, result) after every chunk
+        """
+        try:
+            for chunk in self.iter_key_range(lower, upper, as_csv=Config.USE_COPY):
+                batch_number = next(self._batch_counter)
+                record(batch_number, self._process_chunk(batch_number, chunk))
+        except Exception as e:
+            batch_number = next(self._batch_counter)
+            record(batch_number, self._extraction_failure(batch_number, lower, upper, e))
+    
     def transfer_data(self, drop_target_if_exists: bool = False) -> Dict[str, Any]:
         """Main method to transfer data from source to target"""
+        # An instance reused across scheduled runs must count the source afresh
+        self._total_rows = None
+        
         # Check if table splitting is enabled
         if Config.ENABLE_TABLE_SPLITTING:
             self.logger.info("Table splitting is enabled, using split-based transfer")
@@ -293,8 +633,9 @@ class ETLTransfer:
                 self.prepare_target_table(schema, drop_if_exists=True)
             else:
                 # If table exists, truncate it first                
-                self.prepare_target_table(schema, drop_if_exists=False)
-                self.target_db.truncate_table(Config.TARGET_TABLE, Config.TARGET_SCHEMA)
+                self.prepare_target_table(schema, drop_if_exists=False, truncate=True)
+            
+            self._binary_copy = self._binary_copy_compatible(schema)
             
             # Step 4: Get total rows
             total_rows = self.get_total_rows()
@@ -308,53 +649,157 @@ class ETLTransfer:
                     'batches_processed': 0
                 }
             
-            # Step 5: Calculate batches
-            total_batches = (total_rows + Config.BATCH_SIZE - 1) // Config.BATCH_SIZE
-            self.logger.info(f"Will process {total_batches} batches of {Config.BATCH_SIZE:,} rows each")
+            # Step 5: Calculate batches (parsed batches are loaded in chunks of
+            # at most CHUNK_SIZE rows; raw COPY batches are loaded whole)
+            batch_size = Config.BATCH_SIZE if Config.USE_COPY else min(Config.BATCH_SIZE, Config.CHUNK_SIZE)
+            total_batches = (total_rows + batch_size - 1) // batch_size
+            self.logger.info(f"Will process {total_batches} batches of {batch_size:,} rows each")
             
             # Step 6: Process batches
             processed_rows = 0
             successful_batches = 0
             failed_batches = 0
+            pending = {}
+            self._batch_counter = itertools.count(1)
             
             # Create progress bar
-            pbar = tqdm(total=total_batches, desc="Processing batches")
+            # Redraws are coalesced to one per 250 ms
+            pbar = tqdm(total=total_batches, desc="Processing batches", mininterval=0.25)
             
-            # Process batches with ThreadPoolExecutor for parallel processing
-            with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
-                # Submit all batch tasks
-                future_to_batch = {}
-                for batch_num in range(total_batches):
-                    offset = batch_num * Config.BATCH_SIZE
-                    limit = min(Config.BATCH_SIZE, total_rows - offset)
-                    
-                    future = executor.submit(self.process_batch, batch_num + 1, offset, limit)
-                    future_to_batch[future] = batch_num + 1
+            # Results are only ever aggregated on this thread, so the
+            # counters need no lock
+            def record(batch_num, result):
+                nonlocal processed_rows, successful_batches, failed_batches
+                if result['success']:
+                    processed_rows += result['rows_processed']
+                    successful_batches += 1
+                else:
+                    failed_batches += 1
+                    self.logger.error(f"Batch {batch_num} failed: {result['error']}")
                 
-                # Process completed batches
-                for future in as_completed(future_to_batch):
-                    batch_num = future_to_batch[future]
-                    result = future.result()
+                # The counters are drawn by the next rate-limited refresh of update()
+                pbar.set_postfix_str(f"ok={successful_batches} fail={failed_batches} rows={processed_rows:,}", refresh=False)
+                pbar.update(1)
+            
+            def collect(done_futures):
+                for future in done_futures:
+                    record(pending.pop(future), future.result())
+            
+            primary_key = self.source_db.get_primary_key(Config.SOURCE_TABLE, Config.SOURCE_SCHEMA)
+            if len(primary_key) == 1:
+                # Each worker owns a contiguous primary key range and pages
+                # through it with keyset pagination
+                self.key_column = primary_key[0]
+                key_ranges = self.source_db.get_key_ranges(
+                    Config.SOURCE_TABLE, Config.SOURCE_SCHEMA, self.key_column, Config.MAX_WORKERS
+                )
+                self.logger.info(f"Split {self.key_column} into {len(key_ranges)} key ranges")
+                
+                if self._binary_copy:
+                    # Target columns match the source exactly: each key range
+                    # is piped across in one binary COPY, with no per-batch
+                    # Python work, so progress is reported per key range
+                    self.logger.info("Target columns match the source exactly, using binary COPY")
+                    pbar.reset(total=len(key_ranges))
+                    
+                    with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+                        futures = [
+                            executor.submit(self.transfer_key_range_via_copy, range_number, lower, upper)
+                            for range_number, (lower, upper) in enumerate(key_ranges, start=1)
+                        ]
+                        for future in as_completed(futures):
+                            result = future.result()
+                            record(result['batch_number'], result)
+                elif Config.USE_PROCESS_POOL:
+                    # Worker processes parse and serialize batches without
+                    # sharing the GIL; results are reported per key range
+                    with ProcessPoolExecutor(
+                        max_workers=Config.MAX_WORKERS,
+                        mp_context=multiprocessing.get_context('spawn'),
+                        initializer=_init_worker,
+                        initargs=(schema, self.key_column, self._binary_copy)
+                    ) as executor:
+                        futures = [
+                            executor.submit(_process_key_range_in_worker, range_number, lower, upper)
+                            for range_number, (lower, upper) in enumerate(key_ranges, start=1)
+                        ]
+                        for future in as_completed(futures):
+                            for batch_num, result in future.result():
+                                record(batch_num, result)
+                else:
+                    # One extractor thread per key range feeds a bounded queue
+                    # of chunks that MAX_WORKERS loader threads drain, so the
+                    # source and target work at the same time. Both post their
+                    # results (and a marker when they finish) to this thread.
+                    load_queue = queue.Queue(maxsize=2 * Config.MAX_WORKERS)
+                    results = queue.SimpleQueue()
+                    range_done = object()
+                    loader_done = object()
+                    
+                    def extract_range(lower, upper):
+                        try:
+                            for chunk in self.iter_key_range(lower, upper, as_csv=Config.USE_COPY):
+                                load_queue.put((next(self._batch_counter), chunk))
+                        except Exception as e:
+                            batch_num = next(self._batch_counter)
+                            results.put((batch_num, self._extraction_failure(batch_num, lower, upper, e)))
+                        finally:
+                            results.put(range_done)
+                    
+                    def load_chunks():
+                        try:
+                            while True:
+                                item = load_queue.get()
+                                if item is None:
+                                    return
+                                batch_num, chunk = item
+                                results.put((batch_num, self._process_chunk(batch_num, chunk)))
+                        finally:
+                            results.put(loader_done)
                     
-                    with self.lock:
-                        if result['success']:
-                            processed_rows += result['rows_processed']
-                            successful_batches += 1
-                        else:
-                            failed_batches += 1
-                            self.logger.error(f"Batch {batch_num} failed: {result['error']}")
+                    with ThreadPoolExecutor(max_workers=len(key_ranges) + Config.MAX_WORKERS) as executor:
+                        futures = [executor.submit(extract_range, lower, upper) for lower, upper in key_ranges]
+                        futures += [executor.submit(load_chunks) for _ in range(Config.MAX_WORKERS)]
                         
-                        pbar.update(1)
-                        pbar.set_postfix({
-                            'Processed': f"{processed_rows:,}",
-                            'Success': successful_batches,
-                            'Failed': failed_batches
-                        })
+                        ranges_left = len(key_ranges)
+                        loaders_left = Config.MAX_WORKERS
+                        while loaders_left:
+                            item = results.get()
+                            if item is range_done:
+                                ranges_left -= 1
+                                if ranges_left == 0:
+                                    # Everything is queued; tell the loaders to stop
+                                    for _ in range(Config.MAX_WORKERS):
+                                        load_queue.put(None)
+                            elif item is loader_done:
+                                loaders_left -= 1
+                            else:
+                                record(*item)
+                        
+                        for future in futures:
+                            future.result()
+            
+            else:
+                # Stream batches from the source and hand them to the pool for
+                # loading, keeping at most MAX_WORKERS batches in flight
+                self.logger.info("Source has no single-column primary key, streaming it in one pass")
+                
+                with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+                    for batch_num, df in enumerate(self.extract_batches(), start=1):
+                        future = executor.submit(self.process_batch, batch_num, df)
+                        pending[future] = batch_num
+                        
+                        if len(pending) >= Config.MAX_WORKERS:
+                            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                            collect(done)
+                    
+                    collect(list(pending))
             
             pbar.close()
+            self.finalize_target_table()
             
             # Step 7: Final validation
-            target_rows = self.target_db.get_row_count(Config.TARGET_TABLE, Config.TARGET_SCHEMA)
+            target_rows, target_rows_counted = self.get_target_row_count(processed_rows, verify=failed_batches > 0)
             
             duration = time.time() - start_time
             
@@ -362,6 +807,7 @@ class ETLTransfer:
                 'success': failed_batches == 0,
                 'rows_transferred': processed_rows,
                 'target_rows': target_rows,
+                'target_rows_counted': target_rows_counted,
                 'duration': duration,
                 'batches_processed': successful_batches,
                 'batches_failed': failed_batches,
@@ -370,7 +816,7 @@ class ETLTransfer:
             
             self.logger.info(f"Transfer completed in {duration:.2f} seconds")
             self.logger.info(f"Rows transferred: {processed_rows:,}")
-            self.logger.info(f"Target table rows: {target_rows:,}")
+            self.logger.info(f"Target table rows: {target_rows:,}" + ("" if target_rows_counted else " (from load row counts)"))
             self.logger.info(f"Transfer rate: {result['transfer_rate']:.2f} rows/second")
             
             if failed_batches > 0:
@@ -380,6 +826,12 @@ class ETLTransfer:
             
         except Exception as e:
             self.logger.error(f"Transfer failed: {e}")
+            
+            # Restore the target indexes even though the load failed
+            try:
+                self.finalize_target_table()
+            except Exception:
+                pass  # already logged by create_indexes
             return {
                 'success': False,
                 'error': str(e),
@@ -414,77 +866,82 @@ class ETLTransfer:
         # This is a simplified version - you might want to implement a more sophisticated approach
         return self.transfer_data(drop_target_if_exists=False)
     
-    def create_temp_tables_from_source(self) -> List[str]:
+    def create_temp_tables_from_source(self) -> Dict[str, int]:
         """
         Split source table into multiple temporary tables
         
         Returns:
-            List[str]: List of temporary table names created
+            Dict[str, int]: Row count of each temporary table created, by name, in split order
         """
         self.logger.info("Starting table splitting process...")
         
-        # Get total rows from source table
-        total_rows = self.get_total_rows()
+        # The splits follow heap pages, so the row count is only needed for the
+        # log and the empty check: the planner's estimate will do, and only an
+        # estimate of 0 is confirmed with COUNT(*) (cheap on an empty table)
+        total_rows = self.get_estimated_total_rows()
+        if total_rows == 0:
+            total_rows = self.get_total_rows()
         if total_rows == 0:
             self.logger.warning("Source table is empty, no temporary tables to create")
-            return []
+            return {}
         
-        # Calculate rows per split
-        rows_per_split = total_rows // Config.NUMBER_OF_SPLITS
-        remaining_rows = total_rows % Config.NUMBER_OF_SPLITS
+        # Split the heap into equal page ranges; each split reads only its
+        # own pages, so no split re-scans the rows of the ones before it
+        page_ranges = self.source_db.get_page_ranges(
+            Config.SOURCE_TABLE, Config.SOURCE_SCHEMA, Config.NUMBER_OF_SPLITS
+        )
         
-        self.logger.info(f"Total rows: {total_rows:,}")
+        self.logger.info(f"Total rows (estimated): {total_rows:,}")
         self.logger.info(f"Number of splits: {Config.NUMBER_OF_SPLITS}")
-        self.logger.info(f"Rows per split: {rows_per_split:,}")
-        self.logger.info(f"Remaining rows: {remaining_rows:,}")
+        self.logger.info(f"Approximate rows per split: {total_rows // Config.NUMBER_OF_SPLITS:,}")
         
         temp_table_names = []
-        current_offset = 0
         
-        # Create temporary tables
-        for split_num in range(Config.NUMBER_OF_SPLITS):
-            temp_table_name = f"{Config.SOURCE_TABLE}_{split_num + 1}"
-            temp_table_names.append(temp_table_name)
-            
-            # Calculate limit for this split
-            if split_num < remaining_rows:
-                # Distribute remaining rows among first splits
-                limit = rows_per_split + 1
-            else:
-                limit = rows_per_split
-            
-            self.logger.info(f"Creating temporary table {temp_table_name} (offset={current_offset:,}, limit={limit:,})")
-            
-            # Create temporary table
-            success = self.source_db.create_temp_table_from_source(
-                Config.SOURCE_TABLE,
-                Config.SOURCE_SCHEMA,
-                temp_table_name,
-                Config.ETL_INTERNAL_SCHEMA,
-                current_offset,
-                limit
-            )
-            
-            if not success:
-                self.logger.error(f"Failed to create temporary table {temp_table_name}")
-                # Clean up already created tables
-                self.cleanup_temp_tables(temp_table_names)
-                raise Exception(f"Failed to create temporary table {temp_table_name}")
-            
-            current_offset += limit
+        # Create the schema up front so the concurrent splits don't race on it
+        self.source_db.create_schema_if_not_exists(Config.ETL_INTERNAL_SCHEMA)
+        
+        # Create temporary tables; each CREATE TABLE AS runs in its own backend,
+        # so up to MAX_WORKERS splits are built in parallel on the server
+        with ThreadPoolExecutor(max_workers=min(Config.NUMBER_OF_SPLITS, Config.MAX_WORKERS)) as executor:
+            futures = {}
+            
+            for split_num, (start_page, end_page) in enumerate(page_ranges):
+                temp_table_name = f"{Config.SOURCE_TABLE}_{split_num + 1}"
+                temp_table_names.append(temp_table_name)
+                
+                self.logger.info("Creating temporary table %s (pages %s to %s)", temp_table_name, start_page, end_page)
+                
+                future = executor.submit(
+                    self.source_db.create_temp_table_from_source,
+                    Config.SOURCE_TABLE,
+                    Config.SOURCE_SCHEMA,
+                    temp_table_name,
+                    Config.ETL_INTERNAL_SCHEMA,
+                    start_page,
+                    end_page
+                )
+                futures[future] = temp_table_name
+            
+            temp_table_rows = {name: future.result() for future, name in futures.items()}
+        
+        failed_tables = [name for name, rows in temp_table_rows.items() if rows is None]
+        if failed_tables:
+            self.logger.error(f"Failed to create temporary tables: {', '.join(failed_tables)}")
+            # Clean up already created tables
+            self.cleanup_temp_tables(temp_table_names)
+            raise Exception(f"Failed to create temporary table {failed_tables[0]}")
         
         self.logger.info(f"Successfully created {len(temp_table_names)} temporary tables")
-        return temp_table_names
+        return temp_table_rows
     
-    def process_temp_table_batch(self, temp_table_name: str, batch_number: int, offset: int, limit: int) -> Dict[str, Any]:
+    def process_temp_table_batch(self, temp_table_name: str, batch_number: int, df: pd.DataFrame) -> Dict[str, Any]:
         """
-        Process a single batch from a temporary table
+        Clean and load a single batch extracted from a temporary table
         
         Args:
             temp_table_name: Name of the temporary table
             batch_number: Batch number for logging
-            offset: Offset for data extraction
-            limit: Limit for data extraction
+            df: Batch data extracted from the temporary table
             
         Returns:
             Dict[str, Any]: Batch processing results
@@ -492,34 +949,16 @@ class ETLTransfer:
         start_time = time.time()
         
         try:
-            # Extract from temporary table
-            df = self.source_db.extract_from_temp_table(
-                temp_table_name,
-                Config.ETL_INTERNAL_SCHEMA,
-                offset,
-                limit
-            )
-            
-            if df.empty:
-                return {
-                    'temp_table_name': temp_table_name,
-                    'batch_number': batch_number,
-                    'rows_processed': 0,
-                    'success': True,
-                    'duration': time.time() - start_time,
-                    'error': None
-                }
-            
             # Clean the dataframe
-            df_clean = self._clean_dataframe(df)
+            df = self._clean_dataframe(df)
             
             # Load to target
-            success = self.load_batch(df_clean, f"{temp_table_name}_batch_{batch_number}")
+            success = self.load_batch(df, f"{temp_table_name}_batch_{batch_number}")
             
             return {
                 'temp_table_name': temp_table_name,
                 'batch_number': batch_number,
-                'rows_processed': len(df_clean),
+                'rows_processed': len(df),
                 'success': success,
                 'duration': time.time() - start_time,
                 'error': None if success else "Load failed"
@@ -536,10 +975,182 @@ class ETLTransfer:
                 'error': str(e)
             }
 
+    def _binary_copy_compatible(self, schema: List[Dict[str, Any]]) -> bool:
+        """
+        Check whether rows can be moved from source to target in COPY binary format
+        
+        Binary COPY has no text casts to fall back on, so the target columns
+        must match the source columns exactly, in name, order and type. Array
+        and user-defined types are excluded since their binary form embeds
+        type OIDs that differ between databases.
+        
+        Args:
+            schema: Source table schema as returned by get_source_schema
+            
+        Returns:
+            bool: True if binary COPY can be used for the transfer
+        """
+        if not Config.USE_COPY:
+            return False
+        
+        target_schema = self.target_db.get_table_schema(Config.TARGET_TABLE, Config.TARGET_SCHEMA)
+        source_columns = [(col['name'], col['type']) for col in schema]
+        target_columns = [(col['name'], col['type']) for col in target_schema]
+        
+        return source_columns == target_columns and not any(
+            col_type in ('ARRAY', 'USER-DEFINED') for _, col_type in source_columns
+        )
+    
+    def _pipe_copy(self, table: sql.Identifier, where: sql.Composable = None, params: tuple = None,
+                   binary: bool = True, finish: sql.Composable = None, finish_params: tuple = None) -> int:
+        """
+        Copy rows from a source table into the target table with COPY, bypassing pandas
+        
+        COPY ... TO STDOUT on the source is piped straight into COPY ... FROM
+        STDIN on the target through an OS pipe, so rows are never parsed or
+        buffered in Python. The load runs in a helper thread and is only
+        committed once the extract has finished cleanly.
+        
+        Args:
+            table: Source table identifier
+            where: Optional WHERE condition using %s placeholders
+            params: Parameters for the WHERE condition
+            binary: Use the binary format (see _binary_copy_compatible) rather
+                than text, which the target parses with its own column types
+            finish: Optional statement run on the target in the load's transaction,
+                just before it commits
+            finish_params: Parameters for the finish statement
+            
+        Returns:
+            int: Number of rows loaded
+        """
+        columns = sql.SQL(", ").join(map(sql.Identifier, self._source_columns))
+        select = sql.SQL("SELECT {} FROM {}").format(columns, table)
+        if where is not None:
+            select += sql.SQL(" WHERE ") + where
+        copy_format = " WITH (FORMAT BINARY)" if binary else ""
+        copy_in = sql.SQL("COPY {} ({}) FROM STDIN" + copy_format).format(
+            sql.Identifier(Config.TARGET_SCHEMA, Config.TARGET_TABLE), columns
+        )
+        
+        with self.source_db.get_connection() as source_conn, self.target_db.get_connection() as target_conn:
+            with source_conn.cursor() as cursor:
+                copy_out = f"COPY ({cursor.mogrify(select, params).decode()}) TO STDOUT{copy_format}"
+            
+            read_fd, write_fd = os.pipe()
+            reader = os.fdopen(read_fd, 'rb')
+            writer = os.fdopen(write_fd, 'wb')
+            
+            def load() -> int:
+                # Closing the read end on failure makes the extract fail with
+                # a broken pipe instead of blocking on a full pipe
+                try:
+                    with target_conn.cursor() as cursor:
+                        cursor.copy_expert(copy_in.as_string(target_conn), reader)
+                        return cursor.rowcount
+                finally:
+                    reader.close()
+            
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                loader = executor.submit(load)
+                try:
+                    with source_conn.cursor() as cursor:
+                        cursor.copy_expert(copy_out, writer)
+                finally:
+                    writer.close()
+            
+            rows_loaded = loader.result()
+            if finish is not None:
+                with target_conn.cursor() as cursor:
+                    cursor.execute(finish, finish_params)
+            target_conn.commit()
+        
+        return rows_loaded
+    
+    def transfer_split_via_copy(self, temp_table_name: str) -> int:
+        """
+        Copy a temporary table into the target table with COPY (see _pipe_copy)
+        
+        The binary format is used when the target columns match the source
+        exactly, the text format otherwise. During a checkpointed transfer the
+        table is marked loaded in the same transaction (see _save_checkpoint).
+        
+        Args:
+            temp_table_name: Name of the temporary table in the ETL internal schema
+            
+        Returns:
+            int: Number of rows loaded
+        """
+        finish = finish_params = None
+        if self._checkpoint_run_id:
+            finish = sql.SQL("INSERT INTO {} (target, run_id, temp_table) VALUES (%s, %s, %s)").format(
+                self._checkpoint_table()
+            )
+            finish_params = (f"{Config.TARGET_SCHEMA}.{Config.TARGET_TABLE}", self._checkpoint_run_id, temp_table_name)
+        
+        return self._pipe_copy(
+            sql.Identifier(Config.ETL_INTERNAL_SCHEMA, temp_table_name), binary=self._binary_copy,
+            finish=finish, finish_params=finish_params
+        )
+    
+    def transfer_key_range_via_copy(self, range_number: int, lower: Any, upper: Any) -> Dict[str, Any]:
+        """
+        Copy one primary key range into the target table in COPY binary format (see _pipe_copy)
+        
+        Args:
+            range_number: Key range number for logging
+            lower: Inclusive lower bound of the key range (None for unbounded)
+            upper: Exclusive upper bound of the key range (None for unbounded)
+            
+        Returns:
+            Dict[str, Any]: Key range results, in the same shape as a batch result
+        """
+        start_time = time.time()
+        key = sql.Identifier(self.key_column)
+        conditions = []
+        params = []
+        
+        if lower is not None:
+            conditions.append(sql.SQL("{} >= %s").format(key))
+            params.append(lower)
+        if upper is not None:
+            conditions.append(sql.SQL("{} < %s").format(key))
+            params.append(upper)
+        
+        try:
+            rows_loaded = self._pipe_copy(
+                sql.Identifier(Config.SOURCE_SCHEMA, Config.SOURCE_TABLE),
+                sql.SQL(" AND ").join(conditions) if conditions else None,
+                tuple(params)
+            )
+            self.logger.debug("Copied key range %s [%s, %s) with %s rows", range_number, lower, upper, rows_loaded)
+            return {
+                'batch_number': range_number,
+                'rows_processed': rows_loaded,
+                'success': True,
+                'duration': time.time() - start_time,
+                'error': None
+            }
+        except Exception as e:
+            self.logger.error(f"Key range {range_number} [{lower}, {upper}) failed: {e}")
+            return {
+                'batch_number': range_number,
+                'rows_processed': 0,
+                'success': False,
+                'duration': time.time() - start_time,
+                'error': str(e)
+            }
+    
     def process_temp_table(self, temp_table_name: str, temp_table_index: int) -> Dict[str, Any]:
         """
         Process a single temporary table with multi-threading
         
+        The temporary table is read in a single pass over a server-side cursor
+        (no ORDER BY: load order does not matter and the table has no index),
+        while cleaning and loading run in parallel worker threads. With
+        USE_COPY the table is instead piped to the target with COPY, without
+        going through pandas (see transfer_split_via_copy).
+        
         Args:
             temp_table_name: Name of the temporary table
             temp_table_index: Index of the temporary table (for logging)
@@ -550,11 +1161,11 @@ class ETLTransfer:
         start_time = time.time()
         
         try:
-            self.logger.info(f"Processing temporary table {temp_table_index + 1}: {temp_table_name}")
+            self.logger.info("Processing temporary table %s: %s", temp_table_index + 1, temp_table_name)
             
             # Get row count for this temporary table
             temp_table_rows = self.source_db.get_row_count(temp_table_name, Config.ETL_INTERNAL_SCHEMA)
-            self.logger.info(f"Temporary table {temp_table_name} has {temp_table_rows:,} rows")
+            self.logger.info("Temporary table %s has %s rows", temp_table_name, temp_table_rows)
             
             if temp_table_rows == 0:
                 return {
@@ -566,43 +1177,57 @@ class ETLTransfer:
                     'error': None
                 }
             
+            if Config.USE_COPY:
+                rows_loaded = self.transfer_split_via_copy(temp_table_name)
+                duration = time.time() - start_time
+                self.logger.info("Completed processing %s: %s rows in %.2fs (%s COPY)",
+                                 temp_table_name, rows_loaded, duration, "binary" if self._binary_copy else "text")
+                return {
+                    'temp_table_name': temp_table_name,
+                    'temp_table_index': temp_table_index,
+                    'rows_processed': rows_loaded,
+                    'success': True,
+                    'duration': duration,
+                    'error': None
+                }
+            
             # Calculate batches for this temporary table
-            total_batches = (temp_table_rows + Config.BATCH_SIZE - 1) // Config.BATCH_SIZE
-            self.logger.info(f"Will process {total_batches} batches for {temp_table_name}")
+            batch_size = min(Config.BATCH_SIZE, Config.CHUNK_SIZE)
+            total_batches = (temp_table_rows + batch_size - 1) // batch_size
+            self.logger.info("Will process %s batches for %s", total_batches, temp_table_name)
             
             processed_rows = 0
             successful_batches = 0
             failed_batches = 0
+            pending = {}
             
-            # Process batches with ThreadPoolExecutor for parallel processing
-            with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
-                # Submit all batch tasks
-                future_to_batch = {}
-                for batch_num in range(total_batches):
-                    offset = batch_num * Config.BATCH_SIZE
-                    limit = min(Config.BATCH_SIZE, temp_table_rows - offset)
+            def collect(done_futures):
+                nonlocal processed_rows, successful_batches, failed_batches
+                for future in done_futures:
+                    batch_num = pending.pop(future)
+                    result = future.result()
                     
-                    future = executor.submit(
-                        self.process_temp_table_batch, 
-                        temp_table_name, 
-                        batch_num + 1, 
-                        offset, 
-                        limit
-                    )
-                    future_to_batch[future] = batch_num + 1
+                    if result['success']:
+                        processed_rows += result['rows_processed']
+                        successful_batches += 1
+                    else:
+                        failed_batches += 1
+                        self.logger.error(f"Batch {batch_num} failed for {temp_table_name}: {result['error']}")
+            
+            # Stream the table and hand batches to the pool for loading,
+            # keeping at most MAX_WORKERS batches in flight
+            with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+                batches = self.source_db.stream_source(temp_table_name, Config.ETL_INTERNAL_SCHEMA, batch_size)
                 
-                # Process completed batches
-                for future in as_completed(future_to_batch):
-                    batch_num = future_to_batch[future]
-                    result = future.result()
+                for batch_num, df in enumerate(batches, start=1):
+                    future = executor.submit(self.process_temp_table_batch, temp_table_name, batch_num, df)
+                    pending[future] = batch_num
                     
-                    with self.lock:
-                        if result['success']:
-                            processed_rows += result['rows_processed']
-                            successful_batches += 1
-                        else:
-                            failed_batches += 1
-                            self.logger.error(f"Batch {batch_num} failed for {temp_table_name}: {result['error']}")
+                    if len(pending) >= Config.MAX_WORKERS:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+                
+                collect(list(pending))
             
             duration = time.time() - start_time
             
@@ -617,7 +1242,7 @@ class ETLTransfer:
                 'error': None if failed_batches == 0 else f"{failed_batches} batches failed"
             }
             
-            self.logger.info(f"Completed processing {temp_table_name}: {processed_rows:,} rows in {duration:.2f}s")
+            self.logger.info("Completed processing %s: %s rows in %.2fs", temp_table_name, processed_rows, duration)
             return result
             
         except Exception as e:
@@ -643,6 +1268,12 @@ class ETLTransfer:
         """
         self.logger.info(f"Cleaning up {len(temp_table_names)} temporary tables...")
         
+        if self.source_db.drop_tables(temp_table_names, Config.ETL_INTERNAL_SCHEMA):
+            self.logger.info("All temporary tables cleaned up successfully")
+            return True
+        
+        # Fall back to dropping the tables one by one, so one bad table
+        # doesn't keep the others around
         success_count = 0
         for temp_table_name in temp_table_names:
             if self.source_db.drop_table(temp_table_name, Config.ETL_INTERNAL_SCHEMA):
@@ -657,10 +1288,148 @@ class ETLTransfer:
             self.logger.warning(f"Cleaned up {success_count}/{len(temp_table_names)} temporary tables")
             return False
     
+    @staticmethod
+    def _checkpoint_table() -> sql.Identifier:
+        """Table in the target database recording the temporary tables a checkpointed transfer has loaded"""
+        return sql.Identifier(Config.ETL_INTERNAL_SCHEMA, "split_transfer_checkpoint")
+    
+    def _completed_temp_tables(self, run_id: str) -> List[str]:
+        """
+        Get the temporary tables loaded into the target by a checkpointed transfer
+        
+        Args:
+            run_id: Run id of the checkpoint
+            
+        Returns:
+            List[str]: Names of the temporary tables already loaded
+        """
+        with self.target_db.transaction() as cursor:
+            cursor.execute(
+                sql.SQL("SELECT temp_table FROM {} WHERE run_id = %s ORDER BY temp_table").format(self._checkpoint_table()),
+                (run_id,)
+            )
+            return [row[0] for row in cursor.fetchall()]
+    
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the checkpoint left by an interrupted split transfer of the same tables
+        
+        The checkpoint must be younger than Config.CHECKPOINT_MAX_AGE, so a
+        scheduled run never resumes an old snapshot of the source, and the
+        temporary tables not loaded yet must still hold the rows they were
+        created with: an UNLOGGED table survives a crash of the source server,
+        but comes back empty. Otherwise the checkpoint is discarded together
+        with its temporary tables (see _discard_checkpoint).
+        
+        Returns:
+            Optional[Dict[str, Any]]: The checkpoint, with the temporary tables already
+                loaded under 'completed', or None if there is none or it no longer
+                matches the configuration and the temp tables
+        """
+        if not os.path.exists(Config.CHECKPOINT_PATH):
+            return None
+        
+        try:
+            with open(Config.CHECKPOINT_PATH) as f:
+                checkpoint = json.load(f)
+            
+            temp_table_rows = checkpoint['temp_tables']
+            age = time.time() - checkpoint['created_at']
+            existing_tables = set(self.source_db.get_table_names_in_schema(Config.ETL_INTERNAL_SCHEMA))
+            if age > Config.CHECKPOINT_MAX_AGE:
+                self.logger.warning(f"Ignoring checkpoint {Config.CHECKPOINT_PATH}: it is {age / 3600:.1f} hours old")
+            elif (checkpoint['source'] != f"{Config.SOURCE_SCHEMA}.{Config.SOURCE_TABLE}"
+                    or checkpoint['target'] != f"{Config.TARGET_SCHEMA}.{Config.TARGET_TABLE}"
+                    or not existing_tables.issuperset(temp_table_rows)):
+                self.logger.warning(f"Ignoring checkpoint {Config.CHECKPOINT_PATH}: it does not match this transfer")
+            else:
+                checkpoint['completed'] = self._completed_temp_tables(checkpoint['run_id'])
+                changed_tables = [
+                    temp_table_name for temp_table_name, rows in temp_table_rows.items()
+                    if temp_table_name not in checkpoint['completed']
+                    and self.source_db.get_row_count(temp_table_name, Config.ETL_INTERNAL_SCHEMA) != rows
+                ]
+                if not changed_tables:
+                    return checkpoint
+                
+                self.logger.warning(f"Ignoring checkpoint {Config.CHECKPOINT_PATH}: temporary tables "
+                                    f"{', '.join(changed_tables)} no longer hold the rows they were created with")
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, psycopg2.Error) as e:
+            self.logger.warning(f"Ignoring unreadable checkpoint {Config.CHECKPOINT_PATH}: {e}")
+        
+        self._discard_checkpoint()
+        return None
+    
+    def _discard_checkpoint(self):
+        """
+        Remove the checkpoint file together with the temporary tables it kept
+        
+        Left behind, the tables would make the next split fail on their names.
+        If the file doesn't name them (it is unreadable), every split table of
+        the source table is dropped instead.
+        """
+        try:
+            with open(Config.CHECKPOINT_PATH) as f:
+                temp_table_names = list(json.load(f)['temp_tables'])
+        except (OSError, ValueError, KeyError, TypeError):
+            temp_table_names = None
+        
+        if temp_table_names:
+            self.cleanup_temp_tables(temp_table_names)
+        else:
+            self.source_db.drop_tables_matching(Config.ETL_INTERNAL_SCHEMA, f"{Config.SOURCE_TABLE}_%")
+        os.remove(Config.CHECKPOINT_PATH)
+    
+    def _save_checkpoint(self, checkpoint: Dict[str, Any]):
+        """
+        Start a checkpoint for a split transfer of the given temporary tables
+        
+        The file records the temporary tables and their row counts. Which of
+        them are loaded is recorded in the target database instead, in the
+        transaction that loads each one (see transfer_split_via_copy), so a
+        crash cannot leave a table loaded but not recorded, and a resumed run
+        never loads it twice. Earlier records for the same target are cleared.
+        
+        Args:
+            checkpoint: Source, target, run_id, created_at and temp_tables (row count by name)
+        """
+        with self.target_db.transaction() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    "CREATE SCHEMA IF NOT EXISTS {}; "
+                    "CREATE TABLE IF NOT EXISTS {} (target text NOT NULL, run_id text NOT NULL, "
+                    "temp_table text NOT NULL, loaded_at timestamptz NOT NULL DEFAULT now(), "
+                    "PRIMARY KEY (run_id, temp_table)); "
+                    "DELETE FROM {} WHERE target = %s"
+                ).format(sql.Identifier(Config.ETL_INTERNAL_SCHEMA), self._checkpoint_table(), self._checkpoint_table()),
+                (checkpoint['target'],)
+            )
+        
+        # Replace the old file atomically
+        temp_path = f"{Config.CHECKPOINT_PATH}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(temp_path, Config.CHECKPOINT_PATH)
+    
+    def _clear_checkpoint(self, checkpoint: Dict[str, Any]):
+        """Remove the checkpoint file and its records in the target database"""
+        os.remove(Config.CHECKPOINT_PATH)
+        with self.target_db.transaction() as cursor:
+            cursor.execute(
+                sql.SQL("DELETE FROM {} WHERE run_id = %s").format(self._checkpoint_table()),
+                (checkpoint['run_id'],)
+            )
+    
     def transfer_data_with_splitting(self, drop_target_if_exists: bool = False) -> Dict[str, Any]:
         """
         Transfer data using table splitting approach
         
+        With USE_COPY every temporary table is loaded in a single transaction,
+        so progress is checkpointed (Config.CHECKPOINT_PATH and a table in the
+        target, see _save_checkpoint) with each table. If the transfer fails,
+        the temporary tables are kept and the next run loads only the tables
+        that are not in the target yet, instead of splitting the source again.
+        
         Args:
             drop_target_if_exists: Whether to drop target table if it exists
             
@@ -669,6 +1438,8 @@ class ETLTransfer:
         """
         start_time = time.time()
         temp_table_names = []
+        checkpoint = None
+        self._checkpoint_run_id = None
         
         try:
             self.logger.info("=" * 60)
@@ -686,15 +1457,35 @@ class ETLTransfer:
             # Step 2: Get source schema
             schema = self.get_source_schema()
             
+            # A checkpoint is only resumed if the target is kept and every
+            # temporary table loads atomically
+            if drop_target_if_exists or not Config.USE_COPY:
+                if os.path.exists(Config.CHECKPOINT_PATH):
+                    self._discard_checkpoint()
+            else:
+                checkpoint = self._load_checkpoint()
+            
             # Step 3: Prepare target table
             if drop_target_if_exists:
                 self.prepare_target_table(schema, drop_if_exists=True)
-            else:
+            elif checkpoint:
+                # The target already holds the tables loaded before the interruption
                 self.prepare_target_table(schema, drop_if_exists=False)
-                self.target_db.truncate_table(Config.TARGET_TABLE, Config.TARGET_SCHEMA)
+            else:
+                self.prepare_target_table(schema, drop_if_exists=False, truncate=True)
+            
+            self._binary_copy = self._binary_copy_compatible(schema)
+            if self._binary_copy:
+                self.logger.info("Target columns match the source exactly, using binary COPY")
             
-            # Step 4: Create temporary tables
-            temp_table_names = self.create_temp_tables_from_source()
+            # Step 4: Create temporary tables, or reuse those of the checkpoint
+            if checkpoint:
+                temp_table_names = list(checkpoint['temp_tables'])
+                self.logger.info(f"Resuming from checkpoint: {len(checkpoint['completed'])} of "
+                                 f"{len(temp_table_names)} temporary tables already transferred")
+            else:
+                temp_table_rows = self.create_temp_tables_from_source()
+                temp_table_names = list(temp_table_rows)
             
             if not temp_table_names:
                 self.logger.warning("No temporary tables created, nothing to transfer")
@@ -705,17 +1496,41 @@ class ETLTransfer:
                     'temp_tables_processed': 0
                 }
             
-            # Step 5: Process each temporary table
+            if Config.USE_COPY and not checkpoint:
+                checkpoint = {
+                    'source': f"{Config.SOURCE_SCHEMA}.{Config.SOURCE_TABLE}",
+                    'target': f"{Config.TARGET_SCHEMA}.{Config.TARGET_TABLE}",
+                    'run_id': uuid.uuid4().hex,
+                    'created_at': time.time(),
+                    'temp_tables': temp_table_rows
+                }
+                self._save_checkpoint(checkpoint)
+                checkpoint['completed'] = []
+            
+            if checkpoint:
+                self._checkpoint_run_id = checkpoint['run_id']
+            
+            # Step 5: Process each temporary table not transferred yet
+            completed = set(checkpoint['completed']) if checkpoint else set()
+            pending_temp_tables = [
+                (temp_table_index, temp_table_name)
+                for temp_table_index, temp_table_name in enumerate(temp_table_names)
+                if temp_table_name not in completed
+            ]
             total_rows_transferred = 0
             successful_temp_tables = 0
             failed_temp_tables = 0
             
             # Create progress bar for temporary tables
-            pbar = tqdm(total=len(temp_table_names), desc="Processing temp tables")
-            
-            for temp_table_index, temp_table_name in enumerate(temp_table_names):
-                result = self.process_temp_table(temp_table_name, temp_table_index)
-                
+            # Redraws are coalesced to one per 250 ms
+            pbar = tqdm(total=len(temp_table_names), initial=len(completed),
+                        desc="Processing temp tables", mininterval=0.25)
+            
+            # Results are only recorded on this thread; the checkpoint is
+            # updated by the loads themselves
+            def record(result):
+                nonlocal total_rows_transferred, successful_temp_tables, failed_temp_tables
+                temp_table_name = result['temp_table_name']
                 if result['success']:
                     total_rows_transferred += result['rows_processed']
                     successful_temp_tables += 1
@@ -723,20 +1538,58 @@ class ETLTransfer:
                     failed_temp_tables += 1
                     self.logger.error(f"Temporary table {temp_table_name} failed: {result['error']}")
                 
+                # The counters are drawn by the next rate-limited refresh of update()
+                pbar.set_postfix_str(f"ok={successful_temp_tables} fail={failed_temp_tables} rows={total_rows_transferred:,}", refresh=False)
                 pbar.update(1)
-                pbar.set_postfix({
-                    'Processed': f"{total_rows_transferred:,}",
-                    'Success': successful_temp_tables,
-                    'Failed': failed_temp_tables
-                })
+            
+            if Config.USE_PROCESS_POOL:
+                # The temporary tables are independent, so worker processes
+                # load them side by side, each decoding rows on its own core
+                with ProcessPoolExecutor(
+                    max_workers=Config.MAX_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(schema, self.key_column, self._binary_copy, self._checkpoint_run_id)
+                ) as executor:
+                    futures = [
+                        executor.submit(_process_temp_table_in_worker, temp_table_name, temp_table_index)
+                        for temp_table_index, temp_table_name in pending_temp_tables
+                    ]
+                    for future in as_completed(futures):
+                        record(future.result())
+            elif Config.USE_COPY:
+                # A COPY pipe mostly waits on the two servers (psycopg2 releases
+                # the GIL meanwhile), so threads overlap the temp tables' I/O
+                with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+                    futures = [
+                        executor.submit(self.process_temp_table, temp_table_name, temp_table_index)
+                        for temp_table_index, temp_table_name in pending_temp_tables
+                    ]
+                    for future in as_completed(futures):
+                        record(future.result())
+            else:
+                # Each temporary table is already loaded by a pool of worker threads
+                for temp_table_index, temp_table_name in pending_temp_tables:
+                    record(self.process_temp_table(temp_table_name, temp_table_index))
             
             pbar.close()
             
-            # Step 6: Clean up temporary tables
-            self.cleanup_temp_tables(temp_table_names)
+            self.finalize_target_table()
             
-            # Step 7: Final validation
-            target_rows = self.target_db.get_row_count(Config.TARGET_TABLE, Config.TARGET_SCHEMA)
+            # Step 6: Clean up temporary tables, unless a rerun can resume from them
+            if checkpoint and failed_temp_tables > 0:
+                self.logger.warning(f"Keeping {len(temp_table_names)} temporary tables and {Config.CHECKPOINT_PATH} "
+                                    f"for the next run to retry the failed tables")
+            else:
+                self.cleanup_temp_tables(temp_table_names)
+                if checkpoint:
+                    self._clear_checkpoint(checkpoint)
+            
+            # Step 7: Final validation; after a resumed run the target also
+            # holds the rows loaded by earlier runs, so it has to be counted
+            target_rows, target_rows_counted = self.get_target_row_count(
+                total_rows_transferred, verify=failed_temp_tables > 0 or len(completed) > 0
+            )
             
             duration = time.time() - start_time
             
@@ -744,6 +1597,7 @@ class ETLTransfer:
                 'success': failed_temp_tables == 0,
                 'rows_transferred': total_rows_transferred,
                 'target_rows': target_rows,
+                'target_rows_counted': target_rows_counted,
                 'duration': duration,
                 'temp_tables_processed': successful_temp_tables,
                 'temp_tables_failed': failed_temp_tables,
@@ -752,7 +1606,7 @@ class ETLTransfer:
             
             self.logger.info(f"Transfer with splitting completed in {duration:.2f} seconds")
             self.logger.info(f"Rows transferred: {total_rows_transferred:,}")
-            self.logger.info(f"Target table rows: {target_rows:,}")
+            self.logger.info(f"Target table rows: {target_rows:,}" + ("" if target_rows_counted else " (from load row counts)"))
             self.logger.info(f"Transfer rate: {result['transfer_rate']:.2f} rows/second")
             
             if failed_temp_tables > 0:
@@ -763,12 +1617,58 @@ class ETLTransfer:
         except Exception as e:
             self.logger.error(f"Transfer with splitting failed: {e}")
             
-            # Clean up temporary tables on error
-            if temp_table_names:
+            # Restore the target indexes even though the load failed
+            try:
+                self.finalize_target_table()
+            except Exception:
+                pass  # already logged by create_indexes
+            
+            # Clean up temporary tables on error, unless a rerun can resume from them
+            if checkpoint:
+                self.logger.warning(f"Keeping temporary tables and {Config.CHECKPOINT_PATH} for the next run to resume")
+            elif temp_table_names:
                 self.cleanup_temp_tables(temp_table_names)
             
             return {
                 'success': False,
                 'error': str(e),
                 'duration': time.time() - start_time
-            } 
\ No newline at end of file
+            } 
+
+
+# ETLTransfer owned by each process-pool worker (see _init_worker)
+_worker_transfer: Optional[ETLTransfer] = None
+
+
+def _init_worker(schema: List[Dict[str, Any]], key_column: Optional[str], binary_copy: bool,
+                 checkpoint_run_id: Optional[str] = None):
+    """Process-pool initializer: build the worker's own ETLTransfer and database pools"""
+    global _worker_transfer
+    _worker_transfer = ETLTransfer()
+    _worker_transfer._apply_source_schema(schema)
+    _worker_transfer.key_column = key_column
+    _worker_transfer._binary_copy = binary_copy
+    _worker_transfer._checkpoint_run_id = checkpoint_run_id
+
+
+def _process_key_range_in_worker(range_number: int, lower: Any, upper: Any) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Extract and load one key range inside a worker process
+    
+    Args:
+        range_number: Position of the range, used to label its batches
+        lower: Inclusive lower bound of the key range (None for unbounded)
+        upper: Exclusive upper bound of the key range (None for unbounded)
+        
+    Returns:
+        List[Tuple[str, Dict[str, Any]]]: (batch label, result) for every batch of the range
+    """
+    results = []
+    _worker_transfer._batch_counter = (f"{range_number}.{n}" for n in itertools.count(1))
+    _worker_transfer.process_key_range(lower, upper, lambda batch_num, result: results.append((batch_num, result)))
+    return results
+
+
+def _process_temp_table_in_worker(temp_table_name: str, temp_table_index: int) -> Dict[str, Any]:
+    """Load one temporary table inside a worker process (see ETLTransfer.process_temp_table)"""
+    return _worker_transfer.process_temp_table(temp_table_name, temp_table_index)
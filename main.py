@@ -5,15 +5,29 @@ This script transfers data from source PostgreSQL RDS to target warehouse RDS
 """
 
 import argparse
+import signal
 import sys
-import schedule
 import time
 from datetime import datetime
+from typing import Optional, TYPE_CHECKING
 import logging
 
-from etl_transfer import ETLTransfer
 from config import Config
 
+# etl_transfer pulls in pandas, SQLAlchemy and psycopg2, and schedule is only
+# needed with --schedule; both are imported where used so --help and argument
+# errors return without loading them
+if TYPE_CHECKING:
+    from etl_transfer import ETLTransfer
+
+# Result keys reported after a successful transfer, with their formats
+SUMMARY_FIELDS = [
+    ('rows_transferred', "Rows transferred: {:,}"),
+    ('duration', "Duration: {:.2f} seconds"),
+    ('transfer_rate', "Transfer rate: {:.2f} rows/second"),
+    ('batches_processed', "Batches processed: {}")
+]
+
 def setup_logging():
     """Setup basic logging for the main script"""
     logging.basicConfig(
@@ -26,7 +40,7 @@ def setup_logging():
     )
 
 def run_transfer(drop_target_if_exists: bool = False, incremental: bool = False, 
-                date_column: str = None) -> bool:
+                date_column: str = None, etl: Optional['ETLTransfer'] = None) -> bool:
     """
     Run the ETL transfer process
     
@@ -34,6 +48,7 @@ def run_transfer(drop_target_if_exists: bool = False, incremental: bool = False,
         drop_target_if_exists: Whether to drop target table if it exists
         incremental: Whether to perform incremental transfer
         date_column: Column name for incremental transfer
+        etl: ETLTransfer to reuse (e.g. across scheduled runs); a new one is created if omitted
     
     Returns:
         bool: True if transfer was successful, False otherwise
@@ -41,20 +56,28 @@ def run_transfer(drop_target_if_exists: bool = False, incremental: bool = False,
     logger = logging.getLogger(__name__)
     
     try:
-        logger.info("=" * 60)
-        logger.info("Starting ETL Transfer Process")
-        logger.info(f"Source Table: {Config.SOURCE_TABLE}")
-        logger.info(f"Target Table: {Config.TARGET_TABLE}")
-        logger.info(f"Batch Size: {Config.BATCH_SIZE:,}")
-        logger.info(f"Max Workers: {Config.MAX_WORKERS}")
-        logger.info(f"Table Splitting: {'Enabled' if Config.ENABLE_TABLE_SPLITTING else 'Disabled'}")
+        header = [
+            "=" * 60,
+            "Starting ETL Transfer Process",
+            f"Source Table: {Config.SOURCE_TABLE}",
+            f"Target Table: {Config.TARGET_TABLE}",
+            f"Batch Size: {Config.BATCH_SIZE:,}",
+            f"Max Workers: {Config.MAX_WORKERS}",
+            f"Table Splitting: {'Enabled' if Config.ENABLE_TABLE_SPLITTING else 'Disabled'}"
+        ]
         if Config.ENABLE_TABLE_SPLITTING:
-            logger.info(f"Number of Splits: {Config.NUMBER_OF_SPLITS}")
-            logger.info(f"ETL Internal Schema: {Config.ETL_INTERNAL_SCHEMA}")
-        logger.info("=" * 60)
+            header.append(f"Number of Splits: {Config.NUMBER_OF_SPLITS}")
+            header.append(f"ETL Internal Schema: {Config.ETL_INTERNAL_SCHEMA}")
+        header.append("=" * 60)
+        logger.info("\n".join(header))
         
-        # Initialize ETL transfer
-        etl = ETLTransfer()
+        # Initialize ETL transfer, or make sure a reused one can still connect
+        if etl is None:
+            from etl_transfer import ETLTransfer
+            etl = ETLTransfer()
+        elif not etl.ping():
+            logger.error("❌ Database connection check failed")
+            return False
         
         # Run transfer based on type
         if incremental and date_column:
@@ -66,13 +89,12 @@ def run_transfer(drop_target_if_exists: bool = False, incremental: bool = False,
         
         # Log results
         if result['success']:
-            logger.info("✅ Transfer completed successfully!")
-            logger.info(f"Rows transferred: {result.get('rows_transferred', 0):,}")
-            logger.info(f"Duration: {result.get('duration', 0):.2f} seconds")
-            logger.info(f"Transfer rate: {result.get('transfer_rate', 0):.2f} rows/second")
-            
-            if result.get('batches_processed'):
-                logger.info(f"Batches processed: {result['batches_processed']}")
+            summary = ["✅ Transfer completed successfully!"]
+            for key, fmt in SUMMARY_FIELDS:
+                value = result.get(key)
+                if value is not None:
+                    summary.append(fmt.format(value))
+            logger.info("\n".join(summary))
             
             if result.get('batches_failed', 0) > 0:
                 logger.warning(f"⚠️  {result['batches_failed']} batches failed")
@@ -88,12 +110,18 @@ def run_transfer(drop_target_if_exists: bool = False, incremental: bool = False,
         logger.error(f"❌ Transfer process failed with exception: {e}")
         return False
 
-def run_scheduled_transfer():
-    """Function to run scheduled transfer"""
+def run_scheduled_transfer(etl: 'ETLTransfer'):
+    """
+    Function to run scheduled transfer
+    
+    Args:
+        etl: ETLTransfer shared by every scheduled run, so its connection
+            pools stay open between runs
+    """
     logger = logging.getLogger(__name__)
     logger.info(f"Scheduled transfer started at {datetime.now()}")
     
-    success = run_transfer(drop_target_if_exists=False)
+    success = run_transfer(drop_target_if_exists=False, etl=etl)
     
     if success:
         logger.info("Scheduled transfer completed successfully")
@@ -102,6 +130,10 @@ def run_scheduled_transfer():
     
     return success
 
+def _stop_scheduler(signum, frame):
+    """Turn SIGTERM into the same clean exit as Ctrl+C"""
+    raise KeyboardInterrupt
+
 def main():
     """Main function to handle command line arguments and run transfer"""
     parser = argparse.ArgumentParser(description='ETL Transfer Tool for PostgreSQL RDS')
@@ -124,27 +156,35 @@ def main():
         help='Date column name for incremental transfer'
     )
     
-    parser.add_argument(
+    run_mode = parser.add_mutually_exclusive_group()
+    
+    run_mode.add_argument(
         '--schedule',
         type=str,
         help='Schedule time (e.g., "14:30" for daily at 2:30 PM)'
     )
     
-    parser.add_argument(
+    run_mode.add_argument(
         '--run-now',
         action='store_true',
         help='Run transfer immediately (default behavior)'
     )
     
-    parser.add_argument(
+    splitting = parser.add_mutually_exclusive_group()
+    
+    splitting.add_argument(
         '--enable-splitting',
-        action='store_true',
+        dest='splitting',
+        action='store_const',
+        const=True,
         help='Enable table splitting for large datasets'
     )
     
-    parser.add_argument(
+    splitting.add_argument(
         '--disable-splitting',
-        action='store_true',
+        dest='splitting',
+        action='store_const',
+        const=False,
         help='Disable table splitting (use traditional batch processing)'
     )
     
@@ -156,31 +196,17 @@ def main():
     
     args = parser.parse_args()
     
+    if args.incremental and not args.date_column:
+        parser.error("--date-column is required for --incremental")
+    
     # Setup logging
     setup_logging()
     logger = logging.getLogger(__name__)
     
-    # Validate arguments
-    if args.incremental and not args.date_column:
-        logger.error("Date column is required for incremental transfer")
-        sys.exit(1)
-    
-    if args.schedule and args.run_now:
-        logger.error("Cannot use both --schedule and --run-now")
-        sys.exit(1)
-    
-    if args.enable_splitting and args.disable_splitting:
-        logger.error("Cannot use both --enable-splitting and --disable-splitting")
-        sys.exit(1)
-    
     # Override configuration based on command line arguments
-    if args.enable_splitting:
-        Config.ENABLE_TABLE_SPLITTING = True
-        logger.info("Table splitting enabled via command line")
-    
-    if args.disable_splitting:
-        Config.ENABLE_TABLE_SPLITTING = False
-        logger.info("Table splitting disabled via command line")
+    if args.splitting is not None:
+        Config.ENABLE_TABLE_SPLITTING = args.splitting
+        logger.info(f"Table splitting {'enabled' if args.splitting else 'disabled'} via command line")
     
     if args.splits:
         Config.NUMBER_OF_SPLITS = args.splits
@@ -188,16 +214,23 @@ def main():
     
     # Run based on arguments
     if args.schedule:
+        import schedule
+        from etl_transfer import ETLTransfer
+        
         logger.info(f"Scheduling daily transfer at {args.schedule}")
-        schedule.every().day.at(args.schedule).do(run_scheduled_transfer)
+        schedule.every().day.at(args.schedule).do(run_scheduled_transfer, ETLTransfer())
         
         logger.info("Scheduler started. Press Ctrl+C to stop.")
+        signal.signal(signal.SIGTERM, _stop_scheduler)
         try:
             while True:
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                # Sleep until the next job is due instead of polling
+                next_run = schedule.next_run()
+                delay = 1.0 if next_run is None else max(1.0, (next_run - datetime.now()).total_seconds())
+                time.sleep(delay)
         except KeyboardInterrupt:
-            logger.info("Scheduler stopped by user")
+            logger.info("Scheduler stopped")
     
     else:
         # Run transfer immediately
@@ -0,0 +1,124 @@
+"""
+Tests for resuming a split transfer from its checkpoint (ETLTransfer._load_checkpoint)
+"""
+
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from config import Config
+from etl_transfer import ETLTransfer
+
+
+@pytest.fixture
+def etl(tmp_path, monkeypatch):
+    """ETLTransfer with mocked databases and the checkpoint file in a temporary directory"""
+    monkeypatch.setattr(Config, 'CHECKPOINT_PATH', str(tmp_path / 'etl_checkpoint.json'))
+    etl = ETLTransfer.__new__(ETLTransfer)
+    etl.logger = MagicMock()
+    etl.source_db = MagicMock()
+    etl.source_db.get_table_names_in_schema.return_value = ['items_1', 'items_2']
+    etl.source_db.drop_tables.return_value = True
+    etl._completed_temp_tables = MagicMock(return_value=['items_1'])
+    return etl
+
+
+def write_checkpoint(**overrides):
+    checkpoint = {
+        'source': f"{Config.SOURCE_SCHEMA}.{Config.SOURCE_TABLE}",
+        'target': f"{Config.TARGET_SCHEMA}.{Config.TARGET_TABLE}",
+        'run_id': 'run',
+        'created_at': time.time(),
+        'temp_tables': {'items_1': 100, 'items_2': 50}
+    }
+    checkpoint.update(overrides)
+    with open(Config.CHECKPOINT_PATH, 'w') as f:
+        json.dump(checkpoint, f)
+
+
+def test_no_checkpoint(etl):
+    assert etl._load_checkpoint() is None
+
+
+def test_matching_checkpoint_is_resumed(etl):
+    write_checkpoint()
+    etl.source_db.get_row_count.return_value = 50
+    
+    checkpoint = etl._load_checkpoint()
+    
+    assert checkpoint['completed'] == ['items_1']
+    etl._completed_temp_tables.assert_called_once_with('run')
+    # Only the temporary table still to be loaded is counted
+    etl.source_db.get_row_count.assert_called_once_with('items_2', Config.ETL_INTERNAL_SCHEMA)
+    etl.source_db.drop_tables.assert_not_called()
+
+
+def test_emptied_temp_table_discards_checkpoint(etl):
+    write_checkpoint()
+    etl.source_db.get_row_count.return_value = 0
+    
+    assert etl._load_checkpoint() is None
+    etl.source_db.drop_tables.assert_called_once_with(['items_1', 'items_2'], Config.ETL_INTERNAL_SCHEMA)
+    with pytest.raises(FileNotFoundError):
+        open(Config.CHECKPOINT_PATH)
+
+
+def test_other_transfer_discards_checkpoint(etl):
+    write_checkpoint(target='other.table')
+    
+    assert etl._load_checkpoint() is None
+    etl.source_db.get_row_count.assert_not_called()
+    # The next split would fail on the names of tables left behind
+    etl.source_db.drop_tables.assert_called_once_with(['items_1', 'items_2'], Config.ETL_INTERNAL_SCHEMA)
+    with pytest.raises(FileNotFoundError):
+        open(Config.CHECKPOINT_PATH)
+
+
+def test_missing_temp_table_discards_checkpoint(etl):
+    write_checkpoint(temp_tables={'items_1': 100, 'items_3': 50})
+    
+    assert etl._load_checkpoint() is None
+    etl._completed_temp_tables.assert_not_called()
+    etl.source_db.drop_tables.assert_called_once_with(['items_1', 'items_3'], Config.ETL_INTERNAL_SCHEMA)
+
+
+def test_old_checkpoint_discards_checkpoint(etl, monkeypatch):
+    monkeypatch.setattr(Config, 'CHECKPOINT_MAX_AGE', 3600)
+    write_checkpoint(created_at=time.time() - 2 * 3600)
+    
+    assert etl._load_checkpoint() is None
+    etl._completed_temp_tables.assert_not_called()
+    etl.source_db.drop_tables.assert_called_once_with(['items_1', 'items_2'], Config.ETL_INTERNAL_SCHEMA)
+
+
+@pytest.mark.parametrize('content', ['{not json', '{"source": "public.items"}'])
+def test_unreadable_checkpoint_is_discarded(etl, content):
+    with open(Config.CHECKPOINT_PATH, 'w') as f:
+        f.write(content)
+    
+    assert etl._load_checkpoint() is None
+    etl.logger.warning.assert_called_once()
+    # The file doesn't name its temporary tables, so all splits of the source table go
+    etl.source_db.drop_tables_matching.assert_called_once_with(Config.ETL_INTERNAL_SCHEMA, f"{Config.SOURCE_TABLE}_%")
+    with pytest.raises(FileNotFoundError):
+        open(Config.CHECKPOINT_PATH)
+
+
+def test_checkpoint_without_row_counts_is_discarded(etl):
+    # Written before the checkpoint kept row counts
+    with open(Config.CHECKPOINT_PATH, 'w') as f:
+        json.dump({
+            'source': f"{Config.SOURCE_SCHEMA}.{Config.SOURCE_TABLE}",
+            'target': f"{Config.TARGET_SCHEMA}.{Config.TARGET_TABLE}",
+            'temp_tables': ['items_1'],
+            'completed': [],
+            'failed': []
+        }, f)
+    
+    assert etl._load_checkpoint() is None
+    etl.logger.warning.assert_called_once()
+    etl.source_db.drop_tables.assert_called_once_with(['items_1'], Config.ETL_INTERNAL_SCHEMA)
+    with pytest.raises(FileNotFoundError):
+        open(Config.CHECKPOINT_PATH)
@@ -44,10 +44,10 @@ def test_table_splitting():
             return False
         logger.info("✅ Database connections validated successfully")
         
-        # Test 2: Get source table info
+        # Test 2: Get source table info (the split math only needs an estimate)
         logger.info("Test 2: Getting source table information...")
-        total_rows = etl.get_total_rows()
-        logger.info(f"✅ Source table has {total_rows:,} rows")
+        total_rows = etl.get_estimated_total_rows()
+        logger.info(f"✅ Source table has about {total_rows:,} rows")
         
         # Test 3: Test table splitting calculation
         logger.info("Test 3: Testing table splitting calculation...")
@@ -75,36 +75,27 @@ def test_table_splitting():
             logger.error(f"❌ Failed to create ETL internal schema: {e}")
             return False
         
-        # Test 5: Check existing temporary tables (cleanup if any)
-        logger.info("Test 5: Checking for existing temporary tables...")
-        existing_tables = etl.source_db.get_table_names_in_schema(
-            Config.ETL_INTERNAL_SCHEMA, 
-            f"{Config.SOURCE_TABLE}_%"
-        )
-        
-        if existing_tables:
-            logger.warning(f"Found {len(existing_tables)} existing temporary tables, cleaning up...")
-            for table_name in existing_tables:
-                etl.source_db.drop_table(table_name, Config.ETL_INTERNAL_SCHEMA)
-            logger.info("✅ Cleaned up existing temporary tables")
-        else:
-            logger.info("✅ No existing temporary tables found")
+        # Test 5: Clean up existing temporary tables (if any)
+        logger.info("Test 5: Cleaning up existing temporary tables...")
+        if not etl.source_db.drop_tables_matching(Config.ETL_INTERNAL_SCHEMA, f"{Config.SOURCE_TABLE}_%"):
+            logger.error("❌ Failed to clean up existing temporary tables")
+            return False
+        logger.info("✅ No existing temporary tables left")
         
         # Test 6: Test creating a single temporary table (small subset)
         logger.info("Test 6: Testing temporary table creation...")
         test_temp_table = f"{Config.SOURCE_TABLE}_test"
-        test_limit = min(1000, total_rows)  # Test with max 1000 rows
         
-        success = etl.source_db.create_temp_table_from_source(
+        created_rows = etl.source_db.create_temp_table_from_source(
             Config.SOURCE_TABLE,
             Config.SOURCE_SCHEMA,
             test_temp_table,
             Config.ETL_INTERNAL_SCHEMA,
-            0,  # offset
-            test_limit
+            0,  # start page
+            1  # end page (first page only)
         )
         
-        if success:
+        if created_rows is not None:
             test_rows = etl.source_db.get_row_count(test_temp_table, Config.ETL_INTERNAL_SCHEMA)
             logger.info(f"✅ Created test temporary table with {test_rows:,} rows")
             